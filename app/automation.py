@@ -6,42 +6,54 @@ Cycle (every N minutes via scheduler.py):
   2. Run the engine → get BUY signals with TARGET prices
   3. For each BUY signal:
      a. Skip if we already placed an order for this event (SQLite dedup)
-     b. Query Matchstat for win probability confirmation
+     b. Query Matchstat for win probability confirmation (concurrently)
      c. If Matchstat confirms → place limit order on Kalshi
+        (skipped without recording while a circuit breaker is open)
      d. Record the result in SQLite
 
 Config via env vars:
   DRY_RUN=true                  Don't place real orders (default: true)
   CONTRACTS_PER_TRADE=50        Contracts per order (default: 50)
   MATCHSTAT_MIN_WIN_PCT=0.65    Min Matchstat win% to confirm (default: 65%)
+  MATCHSTAT_CONCURRENCY=8       Max parallel Matchstat lookups per cycle (default: 8)
 """
 
 import os
 import json
+import asyncio
 import logging
-import aiosqlite
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Optional
 
+import aiosqlite
+
 from app.kalshi_client import fetch_tennis_markets
 from app.tennis_data import load_tournament_db
-from app.engine import analyze_all
-from app.models import Signal
-from app.matchstat_client import get_player_win_probability, confirms_signal
-from app.kalshi_orders import place_limit_order, CONTRACTS_PER_TRADE
+from app.engine import analyze_for_trading
+from app.models import MatchData
+from app.matchstat_client import get_player_win_probability, confirms_signal, MATCHSTAT_CB
+from app.kalshi_orders import place_limit_order, CONTRACTS_PER_TRADE, KALSHI_CB
+from app.circuit_breaker import CircuitOpenError
+from app.db import get_conn, transaction, enable_wal, fetch_page
 
 logger = logging.getLogger(__name__)
 
-DB_PATH = Path(__file__).parent.parent / "data" / "orders.db"
-
 # DRY_RUN=true by default — set DRY_RUN=false in .env to place real orders
 DRY_RUN: bool = os.getenv("DRY_RUN", "true").lower() != "false"
 
-# Global state (in-memory, reset on server restart)
-_last_run: Optional[datetime] = None
-_last_run_summary: dict = {}
-_total_orders_this_session: int = 0
+MATCHSTAT_CONCURRENCY = int(os.getenv("MATCHSTAT_CONCURRENCY", "8"))
+
+
+@dataclass
+class AutomationState:
+    """In-memory automation state (reset on server restart)."""
+    last_run: Optional[datetime] = None
+    last_run_summary: dict = field(default_factory=dict)
+    total_orders_this_session: int = 0
+
+
+_state = AutomationState()
 
 
 # ---------------------------------------------------------------------------
@@ -49,9 +61,9 @@ _total_orders_this_session: int = 0
 # ---------------------------------------------------------------------------
 
 async def init_db():
-    """Create the orders tracking table if it doesn't exist."""
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    async with aiosqlite.connect(DB_PATH) as db:
+    """Create the orders tracking table if it doesn't exist (and enable WAL)."""
+    async with transaction() as db:
+        await enable_wal(db)
         await db.execute("""
             CREATE TABLE IF NOT EXISTS placed_orders (
                 id               INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -70,20 +82,102 @@ async def init_db():
                 order_response   TEXT
             )
         """)
-        await db.commit()
+        # One row per event, enforced by SQLite
+        await _set_aside_duplicate_orders(db)
+        await db.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_event_ticker ON placed_orders(event_ticker)"
+        )
+        # Newest-first listing / keyset pagination (get_all_orders)
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_placed_at ON placed_orders(placed_at)"
+        )
+        # A claim left 'pending' means a cycle died around place_limit_order —
+        # the order may or may not be on Kalshi, so it is never retried blindly
+        cursor = await db.execute("SELECT COUNT(*) FROM placed_orders WHERE status = 'pending'")
+        (stuck,) = await cursor.fetchone()
+        if stuck:
+            logger.warning(
+                f"{stuck} order(s) left 'pending' by an interrupted cycle — "
+                "check them on Kalshi, then update or delete the rows"
+            )
 
 
-async def already_ordered(event_ticker: str) -> bool:
-    """Return True if we already processed this event (any status)."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        cursor = await db.execute(
-            "SELECT id FROM placed_orders WHERE event_ticker = ?",
-            (event_ticker,),
-        )
-        return await cursor.fetchone() is not None
+_DUPLICATE_ORDERS_WHERE = (
+    "id NOT IN (SELECT MIN(id) FROM placed_orders GROUP BY event_ticker)"
+)
 
 
-async def record_order(
+async def _set_aside_duplicate_orders(db: aiosqlite.Connection):
+    """
+    Make room for the UNIQUE(event_ticker) index on a DB from before it.
+    Extra rows per event (which can be real orders from overlapping cycles)
+    are moved to placed_orders_duplicates, not deleted; the first row of
+    each event stays. No-op once the index exists.
+    """
+    cursor = await db.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'uq_event_ticker'"
+    )
+    if await cursor.fetchone():
+        return
+    cursor = await db.execute(f"SELECT COUNT(*) FROM placed_orders WHERE {_DUPLICATE_ORDERS_WHERE}")
+    (duplicates,) = await cursor.fetchone()
+    if not duplicates:
+        return
+    await db.execute(
+        "CREATE TABLE IF NOT EXISTS placed_orders_duplicates AS "
+        "SELECT * FROM placed_orders WHERE 0"
+    )
+    await db.execute(
+        f"INSERT INTO placed_orders_duplicates "
+        f"SELECT * FROM placed_orders WHERE {_DUPLICATE_ORDERS_WHERE}"
+    )
+    await db.execute(f"DELETE FROM placed_orders WHERE {_DUPLICATE_ORDERS_WHERE}")
+    logger.warning(
+        f"{duplicates} duplicate placed_orders row(s) moved to placed_orders_duplicates "
+        "— review them, some may be real orders"
+    )
+
+
+async def load_ordered_event_tickers() -> set[str]:
+    """Return every event we already processed (any status), for O(1) dedup."""
+    db = await get_conn()
+    cursor = await db.execute("SELECT event_ticker FROM placed_orders")
+    return {row[0] for row in await cursor.fetchall()}
+
+
+ORDER_COLUMNS = (
+    "id", "event_ticker", "ticker", "player_fav", "player_dog", "tournament",
+    "target_price", "contracts", "kalshi_price", "matchstat_win_pct",
+    "dry_run", "status", "placed_at", "order_response",
+)
+# Default projection for list views — order_response (raw Kalshi JSON) is
+# the bulk of each row and only needed when inspecting a single order
+ORDER_LIST_COLUMNS = tuple(c for c in ORDER_COLUMNS if c != "order_response")
+
+# Every event goes claim → finish/release. A cycle first claims each
+# candidate by inserting a 'pending' row; UNIQUE(event_ticker) lets exactly
+# one claim win, so two overlapping cycles (the scheduler plus a manual
+# /automation/run-once) can never both call Matchstat or Kalshi for the same
+# event. The winner then finishes the row with the outcome, or releases it
+# (deletes it) when the event should be retried next cycle.
+# Column order matches the tuples built by _order_row.
+_CLAIM_ORDER_SQL = """
+    INSERT OR IGNORE INTO placed_orders
+        (event_ticker, ticker, player_fav, player_dog, tournament,
+         target_price, contracts, kalshi_price, matchstat_win_pct,
+         dry_run, status, placed_at, order_response)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# Parameters: (contracts, matchstat_win_pct, status, order_response, event_ticker)
+_FINISH_ORDER_SQL = """
+    UPDATE placed_orders
+    SET contracts = ?, matchstat_win_pct = ?, status = ?, order_response = ?
+    WHERE event_ticker = ? AND status = 'pending'
+"""
+_RELEASE_ORDER_SQL = "DELETE FROM placed_orders WHERE event_ticker = ? AND status = 'pending'"
+
+
+def _order_row(
     event_ticker: str,
     ticker: str,
     player_fav: str,
@@ -95,56 +189,117 @@ async def record_order(
     matchstat_win_pct: Optional[float],
     dry_run: bool,
     status: str,
+    placed_at: str,
     order_response: str,
-):
-    """Persist an order (or rejection) to SQLite."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            """
-            INSERT INTO placed_orders
-                (event_ticker, ticker, player_fav, player_dog, tournament,
-                 target_price, contracts, kalshi_price, matchstat_win_pct,
-                 dry_run, status, placed_at, order_response)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                event_ticker, ticker, player_fav, player_dog, tournament,
-                target_price, contracts, kalshi_price, matchstat_win_pct,
-                1 if dry_run else 0, status,
-                datetime.now(timezone.utc).isoformat(),
-                order_response,
-            ),
-        )
-        await db.commit()
+) -> tuple:
+    """Build one placed_orders row (column order matches _CLAIM_ORDER_SQL)."""
+    return (
+        event_ticker, ticker, player_fav, player_dog, tournament,
+        target_price, contracts, kalshi_price, matchstat_win_pct,
+        1 if dry_run else 0, status, placed_at, order_response,
+    )
 
 
-async def get_all_orders() -> list[dict]:
-    """Return all recorded orders (newest first, max 200 rows)."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute(
-            "SELECT * FROM placed_orders ORDER BY placed_at DESC LIMIT 200"
-        )
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+async def claim_events(rows: list[tuple]) -> set[str]:
+    """
+    Insert 'pending' rows (built by _order_row) in one commit and return the
+    event tickers this call won. An event that already has a row — from an
+    earlier cycle or one running right now — is not claimed.
+    """
+    claimed: set[str] = set()
+    if not rows:
+        return claimed
+    async with transaction() as db:
+        for row in rows:
+            cursor = await db.execute(_CLAIM_ORDER_SQL, row)
+            if cursor.rowcount == 1:
+                claimed.add(row[0])
+    return claimed
+
+
+async def finish_orders(rows: list[tuple]):
+    """Record the outcome of claimed events, in one commit (see _FINISH_ORDER_SQL)."""
+    if not rows:
+        return
+    async with transaction() as db:
+        await db.executemany(_FINISH_ORDER_SQL, rows)
+
+
+async def release_events(event_tickers: list[str]):
+    """Drop the claims on events that should be retried next cycle."""
+    if not event_tickers:
+        return
+    async with transaction() as db:
+        await db.executemany(_RELEASE_ORDER_SQL, [(e,) for e in event_tickers])
+
+
+async def get_all_orders(
+    limit: int = 200,
+    cursor: Optional[str] = None,
+    columns: tuple[str, ...] = ORDER_LIST_COLUMNS,
+) -> dict:
+    """
+    Return recorded orders, newest first, one page at a time.
+    Pass the returned next_cursor back in to get the following page.
+    Returns {"rows": [...], "next_cursor": str | None}.
+    """
+    return await fetch_page(
+        "placed_orders", "placed_at", columns, ORDER_COLUMNS,
+        limit=limit, cursor=cursor,
+    )
 
 
 # ---------------------------------------------------------------------------
 # Main automation cycle
 # ---------------------------------------------------------------------------
 
+async def _confirm_with_matchstat(
+    matches: list[MatchData],
+) -> list[Optional[float] | Exception]:
+    """
+    Query Matchstat for every candidate concurrently (at most
+    MATCHSTAT_CONCURRENCY requests in flight). Returns win% per match,
+    in input order. A lookup that raised (CircuitOpenError when Matchstat's
+    breaker is open, or a transient error such as a 429) is returned as the
+    exception, so the caller can skip the match without recording it.
+
+    The same pairing showing up twice in a cycle (same players, same tour)
+    is looked up once — the H2H answer only depends on that key.
+    """
+    sem = asyncio.Semaphore(MATCHSTAT_CONCURRENCY)
+
+    async def _one(player_fav: str, player_dog: str, tournament_level) -> Optional[float]:
+        async with sem:
+            return await get_player_win_probability(
+                player_fav=player_fav,
+                player_dog=player_dog,
+                tournament_level=tournament_level,
+            )
+
+    keys = [(m.player_fav.name, m.player_dog.name, m.tournament_level) for m in matches]
+    unique = list(dict.fromkeys(keys))
+
+    results = await asyncio.gather(*(_one(*key) for key in unique), return_exceptions=True)
+    for key, res in zip(unique, results):
+        if isinstance(res, Exception) and not isinstance(res, CircuitOpenError):
+            logger.error(f"Matchstat lookup failed for {key[0]} vs {key[1]}: {res}")
+    by_key = dict(zip(unique, results))
+
+    return [by_key[key] for key in keys]
+
+
 async def run_automation_cycle() -> dict:
     """
     Execute one complete automation cycle.
     Called by the scheduler every N minutes.
     Returns a summary dict of what happened.
     """
-    global _last_run, _last_run_summary, _total_orders_this_session
-
-    _last_run = datetime.now(timezone.utc)
+    _state.last_run = datetime.now(timezone.utc)
+    # One timestamp for every row written this cycle
+    placed_at = _state.last_run.isoformat()
 
     summary = {
-        "started_at": _last_run.isoformat(),
+        "started_at": placed_at,
         "dry_run": DRY_RUN,
         "markets_fetched": 0,
         "buy_signals": 0,
@@ -155,6 +310,8 @@ async def run_automation_cycle() -> dict:
         "orders_placed": 0,
         "orders_failed": 0,
         "skipped_no_ticker": 0,
+        "skipped_circuit_open": 0,
+        "skipped_matchstat_error": 0,
         "details": [],
     }
 
@@ -164,108 +321,177 @@ async def run_automation_cycle() -> dict:
         matches = await fetch_tennis_markets(tournament_db)
         summary["markets_fetched"] = len(matches)
 
-        results = analyze_all(matches)
-        buy_signals = [r for r in results if r.signal == Signal.BUY]
+        buy_signals = analyze_for_trading(matches)
         summary["buy_signals"] = len(buy_signals)
 
         logger.info(
             f"Cycle: {len(matches)} markets → {len(buy_signals)} BUY signals"
         )
 
-        # Step 2: Process each BUY signal
-        for result in buy_signals:
-            m = result.match
-            event_ticker = m.kalshi_event_ticker or ""
-            ticker = m.kalshi_ticker or ""
-            target_cents = int(round(result.target_price * 100))
-
-            detail = {
-                "player_fav": m.player_fav.name,
-                "player_dog": m.player_dog.name,
-                "tournament": m.tournament_name,
-                "kalshi_price": m.kalshi_price,
-                "target_price": target_cents,
-                "ticker": ticker,
-                "event_ticker": event_ticker,
-            }
-
-            # Guard: must have valid tickers
-            if not ticker or not event_ticker:
-                detail["action"] = "skipped_no_ticker"
-                summary["skipped_no_ticker"] += 1
-                summary["details"].append(detail)
-                continue
-
-            # Guard: skip if already processed this event
-            if await already_ordered(event_ticker):
-                detail["action"] = "already_ordered"
-                summary["already_ordered"] += 1
-                summary["details"].append(detail)
-                continue
-
-            # Step 3: Confirm with Matchstat (H2H histórico)
-            summary["matchstat_checked"] += 1
-            win_pct = await get_player_win_probability(
-                player_fav=m.player_fav.name,
-                player_dog=m.player_dog.name,
-                tournament_level=m.tournament_level,
-            )
-            detail["matchstat_win_pct"] = round(win_pct * 100, 1) if win_pct is not None else None
-            matchstat_ok = confirms_signal(win_pct)
-            detail["matchstat_confirmed"] = matchstat_ok
-
-            if not matchstat_ok:
-                detail["action"] = "matchstat_rejected"
-                summary["matchstat_rejected"] += 1
-                # Record the rejection so we don't re-check this event
-                await record_order(
+        # Step 2: Process each BUY signal. Rejection and dry-run rows are
+        # buffered and flushed in a single commit at the end of the cycle
+        finished_rows: list[tuple] = []
+        released: list[str] = []
+        # Claimed events not yet handed to Kalshi — released if the cycle
+        # stops early, so they are retried instead of staying pending
+        unsent: set[str] = set()
+        # Cheap pre-filter; claim_events below is what makes dedup race-free
+        ordered_events = await load_ordered_event_tickers()
+        try:
+            # Guards first, so only real candidates are claimed and hit Matchstat
+            candidates = []
+            for result in buy_signals:
+                m = result.match
+                event_ticker = m.kalshi_event_ticker or ""
+                ticker = m.kalshi_ticker or ""
+                target_cents = int(round(result.target_price * 100))
+
+                detail = {
+                    "player_fav": m.player_fav.name,
+                    "player_dog": m.player_dog.name,
+                    "tournament": m.tournament_name,
+                    "kalshi_price": m.kalshi_price,
+                    "target_price": target_cents,
+                    "ticker": ticker,
+                    "event_ticker": event_ticker,
+                }
+
+                # Guard: must have valid tickers
+                if not ticker or not event_ticker:
+                    detail["action"] = "skipped_no_ticker"
+                    summary["skipped_no_ticker"] += 1
+                    summary["details"].append(detail)
+                    continue
+
+                # Guard: skip if already processed this event
+                if event_ticker in ordered_events:
+                    detail["action"] = "already_ordered"
+                    summary["already_ordered"] += 1
+                    summary["details"].append(detail)
+                    continue
+
+                ordered_events.add(event_ticker)
+                candidates.append((m, event_ticker, ticker, target_cents, detail))
+
+            # Claim every candidate before any Matchstat/Kalshi call. Events
+            # claimed by an overlapping cycle in the meantime are dropped here.
+            claimed = await claim_events([
+                _order_row(
                     event_ticker=event_ticker, ticker=ticker,
-                    player_fav=m.player_fav.name, player_dog=m.player_dog.name,
-                    tournament=m.tournament_name, target_price=target_cents,
-                    contracts=0, kalshi_price=m.kalshi_price,
-                    matchstat_win_pct=win_pct, dry_run=DRY_RUN,
-                    status="rejected_by_matchstat", order_response="",
+                    player_fav=detail["player_fav"], player_dog=detail["player_dog"],
+                    tournament=detail["tournament"], target_price=target_cents,
+                    contracts=0, kalshi_price=detail["kalshi_price"],
+                    matchstat_win_pct=None, dry_run=DRY_RUN,
+                    status="pending", placed_at=placed_at, order_response="",
+                )
+                for _, event_ticker, ticker, target_cents, detail in candidates
+            ])
+            unsent.update(claimed)
+            for c in candidates:
+                if c[1] not in claimed:
+                    c[4]["action"] = "already_ordered"
+                    summary["already_ordered"] += 1
+                    summary["details"].append(c[4])
+            candidates = [c for c in candidates if c[1] in claimed]
+
+            # Step 3: Confirm with Matchstat (H2H histórico) — concurrently
+            summary["matchstat_checked"] += len(candidates)
+            win_pcts = await _confirm_with_matchstat([c[0] for c in candidates])
+
+            for (m, event_ticker, ticker, target_cents, detail), win_pct in zip(candidates, win_pcts):
+                # Matchstat is down — release the event so the next cycle retries it
+                if isinstance(win_pct, CircuitOpenError):
+                    unsent.discard(event_ticker)
+                    released.append(event_ticker)
+                    detail["action"] = "skipped_circuit_open"
+                    summary["skipped_circuit_open"] += 1
+                    summary["details"].append(detail)
+                    continue
+
+                # Lookup failed (429, timeout, ...) — not a verdict on the
+                # match, so it is released and retried next cycle
+                if isinstance(win_pct, Exception):
+                    unsent.discard(event_ticker)
+                    released.append(event_ticker)
+                    detail["action"] = "skipped_matchstat_error"
+                    summary["skipped_matchstat_error"] += 1
+                    summary["details"].append(detail)
+                    continue
+
+                detail["matchstat_win_pct"] = round(win_pct * 100, 1) if win_pct is not None else None
+                matchstat_ok = confirms_signal(win_pct)
+                detail["matchstat_confirmed"] = matchstat_ok
+
+                if not matchstat_ok:
+                    detail["action"] = "matchstat_rejected"
+                    summary["matchstat_rejected"] += 1
+                    # Record the rejection so we don't re-check this event
+                    unsent.discard(event_ticker)
+                    finished_rows.append(
+                        (0, win_pct, "rejected_by_matchstat", "", event_ticker)
+                    )
+                    summary["details"].append(detail)
+                    continue
+
+                summary["matchstat_confirmed"] += 1
+
+                # Step 4: Place the limit order (sequential — Kalshi rate limits
+                # writes far tighter than reads and a 429'd POST is not
+                # retried; a cycle places only a handful, so gather() would
+                # save little). Market reads are already concurrent.
+                # From here on the claim is only released explicitly: if the
+                # cycle dies mid-call the row stays 'pending' rather than
+                # risking a second order next cycle.
+                unsent.discard(event_ticker)
+                order_result = await place_limit_order(
+                    ticker=ticker,
+                    yes_price=target_cents,
+                    count=CONTRACTS_PER_TRADE,
+                    dry_run=DRY_RUN,
                 )
-                summary["details"].append(detail)
-                continue
-
-            summary["matchstat_confirmed"] += 1
 
-            # Step 4: Place the limit order
-            order_result = await place_limit_order(
-                ticker=ticker,
-                yes_price=target_cents,
-                count=CONTRACTS_PER_TRADE,
-                dry_run=DRY_RUN,
-            )
+                order_status = order_result.get("status", "unknown")
+                if order_status == "circuit_open":
+                    # Nothing was sent to Kalshi — retry this event next cycle
+                    released.append(event_ticker)
+                    detail["action"] = "skipped_circuit_open"
+                    summary["skipped_circuit_open"] += 1
+                    summary["details"].append(detail)
+                    continue
+
+                detail["action"] = f"order_{order_status}"
+                detail["order_result"] = order_result
+
+                if order_status in ("placed", "simulated"):
+                    summary["orders_placed"] += 1
+                    _state.total_orders_this_session += 1
+                else:
+                    summary["orders_failed"] += 1
+
+                # Record in SQLite. Encoded here, outside the DB write, as
+                # compact JSON (no whitespace)
+                order_response = json.dumps(order_result, separators=(",", ":"))
+                row = (CONTRACTS_PER_TRADE, win_pct, order_status, order_response, event_ticker)
+                if DRY_RUN:
+                    # Nothing real was sent — batched with the rejections
+                    finished_rows.append(row)
+                else:
+                    # A live order is committed before the next one goes out,
+                    # so a crash or redeploy mid-cycle loses at most the
+                    # order in flight (its claim stays 'pending')
+                    await finish_orders([row])
 
-            order_status = order_result.get("status", "unknown")
-            detail["action"] = f"order_{order_status}"
-            detail["order_result"] = order_result
-
-            if order_status in ("placed", "simulated"):
-                summary["orders_placed"] += 1
-                _total_orders_this_session += 1
-            else:
-                summary["orders_failed"] += 1
-
-            # Record in SQLite
-            await record_order(
-                event_ticker=event_ticker, ticker=ticker,
-                player_fav=m.player_fav.name, player_dog=m.player_dog.name,
-                tournament=m.tournament_name, target_price=target_cents,
-                contracts=CONTRACTS_PER_TRADE, kalshi_price=m.kalshi_price,
-                matchstat_win_pct=win_pct, dry_run=DRY_RUN,
-                status=order_status, order_response=json.dumps(order_result),
-            )
+                summary["details"].append(detail)
 
-            summary["details"].append(detail)
+        finally:
+            await finish_orders(finished_rows)
+            await release_events(released + sorted(unsent))
 
     except Exception as e:
         logger.error(f"Automation cycle error: {e}", exc_info=True)
         summary["error"] = str(e)
 
-    _last_run_summary = summary
+    _state.last_run_summary = summary
     logger.info(
         f"Cycle complete — {summary['orders_placed']} orders"
         f" ({summary['matchstat_confirmed']} Matchstat confirmed)"
@@ -278,12 +504,16 @@ def get_status() -> dict:
     """Return current automation state for the status API endpoint."""
     return {
         "dry_run": DRY_RUN,
-        "last_run": _last_run.isoformat() if _last_run else None,
-        "total_orders_this_session": _total_orders_this_session,
-        "last_run_summary": _last_run_summary,
+        "last_run": _state.last_run.isoformat() if _state.last_run else None,
+        "total_orders_this_session": _state.total_orders_this_session,
+        "last_run_summary": _state.last_run_summary,
         "config": {
             "contracts_per_trade": CONTRACTS_PER_TRADE,
             "matchstat_min_win_pct": float(os.getenv("MATCHSTAT_MIN_WIN_PCT", "0.65")),
             "matchstat_api_configured": bool(os.getenv("MATCHSTAT_API_KEY")),
         },
+        "circuits": {
+            "matchstat": MATCHSTAT_CB.snapshot(),
+            "kalshi_orders": KALSHI_CB.snapshot(),
+        },
     }
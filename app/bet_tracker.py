@@ -9,15 +9,13 @@ Flow:
 Table: tracked_bets (separate from placed_orders which is for bot automation)
 """
 
-import aiosqlite
 import logging
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Optional
 
-logger = logging.getLogger(__name__)
+from app.db import get_conn, transaction, enable_wal, fetch_page
 
-DB_PATH = Path(__file__).parent.parent / "data" / "orders.db"
+logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
@@ -25,9 +23,9 @@ DB_PATH = Path(__file__).parent.parent / "data" / "orders.db"
 # ---------------------------------------------------------------------------
 
 async def init_bets_db():
-    """Create tracked_bets table if it doesn't exist."""
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    async with aiosqlite.connect(DB_PATH) as db:
+    """Create tracked_bets table if it doesn't exist (and enable WAL)."""
+    async with transaction() as db:
+        await enable_wal(db)
         await db.execute("""
             CREATE TABLE IF NOT EXISTS tracked_bets (
                 id                   INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -55,7 +53,12 @@ async def init_bets_db():
                 status               TEXT    NOT NULL DEFAULT 'pending'
             )
         """)
-        await db.commit()
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tracked_status ON tracked_bets(status)"
+        )
+        await db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_tracked_at ON tracked_bets(tracked_at)"
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -79,7 +82,7 @@ async def track_bet(
     """
     tracked_at = datetime.now(timezone.utc).isoformat()
 
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with transaction() as db:
         cursor = await db.execute(
             """
             INSERT INTO tracked_bets
@@ -94,7 +97,6 @@ async def track_bet(
                 target_price, tracked_at,
             ),
         )
-        await db.commit()
         bet_id = cursor.lastrowid
 
     return await get_bet_by_id(bet_id)
@@ -104,43 +106,41 @@ async def track_bet(
 # Moment 2 — Record outcome (manual user input)
 # ---------------------------------------------------------------------------
 
-def _calculate_outcome(
-    target_price: int,
-    lowest_price_reached: int,
-    match_outcome: str,
-    contracts: int,
-) -> dict:
-    """
-    Given the two manual inputs + contracts, derive all calculated fields.
-
-    order_filled : lowest_price_reached <= target_price
-    fill_price   : target_price if filled, else None
-    edge         : lowest_price_reached - target_price
-                   (negative = price went below target, good)
-                   (positive = price never reached target, didn't fill)
-    pnl          : profit/loss in dollars
-                   filled + fav_won  → (100 - fill_price) * contracts / 100
-                   filled + fav_lost → -(fill_price * contracts) / 100
-                   not filled        → 0.0
-    """
-    order_filled = 1 if lowest_price_reached <= target_price else 0
-    fill_price = target_price if order_filled else None
-    edge = lowest_price_reached - target_price
-
-    if order_filled and contracts:
-        if match_outcome == "fav_won":
-            pnl = round((100 - fill_price) * contracts / 100, 2)
-        else:  # fav_lost
-            pnl = round(-(fill_price * contracts) / 100, 2)
-    else:
-        pnl = 0.0
+# Derived fields, computed in the UPDATE from the row's own target_price so
+# the write needs no prior read:
+#   order_filled : lowest_price_reached <= target_price
+#   fill_price   : target_price if filled, else NULL
+#   edge         : lowest_price_reached - target_price
+#                  (negative = price went below target, good)
+#                  (positive = price never reached target, didn't fill)
+#   pnl          : profit/loss in dollars
+#                  filled + fav_won  → (100 - fill_price) * contracts / 100
+#                  filled + fav_lost → -(fill_price * contracts) / 100
+#                  not filled        → 0.0
+_UPDATE_OUTCOME_SQL = """
+    UPDATE tracked_bets
+    SET contracts            = :contracts,
+        lowest_price_reached = :lowest,
+        match_outcome        = :outcome,
+        order_filled         = (:lowest <= target_price),
+        fill_price           = CASE WHEN :lowest <= target_price THEN target_price END,
+        edge                 = :lowest - target_price,
+        pnl                  = CASE
+            WHEN :lowest <= target_price AND :contracts THEN ROUND(
+                CASE WHEN :outcome = 'fav_won'
+                     THEN (100 - target_price) * :contracts / 100.0
+                     ELSE -(target_price * :contracts) / 100.0
+                END, 2)
+            ELSE 0.0
+        END,
+        status               = 'completed'
+    WHERE id = :id
+    RETURNING *
+"""
 
-    return {
-        "order_filled": order_filled,
-        "fill_price": fill_price,
-        "edge": edge,
-        "pnl": pnl,
-    }
+# RETURNING hands back values before column affinity is applied, so a REAL
+# column can come back as an int (80 instead of 80.0) — unlike a SELECT
+_REAL_COLUMNS = ("fav_probability", "pnl")
 
 
 async def update_outcome(
@@ -152,47 +152,25 @@ async def update_outcome(
     """
     Update a tracked bet with outcome data entered by the user.
     Automatically calculates order_filled, fill_price, edge, and pnl.
-    Returns the updated record or None if not found.
+    Returns the updated record or None if not found — one statement,
+    no read before or after the write.
     """
-    bet = await get_bet_by_id(bet_id)
-    if not bet:
-        return None
-
-    derived = _calculate_outcome(
-        target_price=bet["target_price"],
-        lowest_price_reached=lowest_price_reached,
-        match_outcome=match_outcome,
-        contracts=contracts,
-    )
-
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            """
-            UPDATE tracked_bets
-            SET contracts            = ?,
-                lowest_price_reached = ?,
-                match_outcome        = ?,
-                order_filled         = ?,
-                fill_price           = ?,
-                edge                 = ?,
-                pnl                  = ?,
-                status               = 'completed'
-            WHERE id = ?
-            """,
-            (
-                contracts,
-                lowest_price_reached,
-                match_outcome,
-                derived["order_filled"],
-                derived["fill_price"],
-                derived["edge"],
-                derived["pnl"],
-                bet_id,
-            ),
-        )
-        await db.commit()
+    async with transaction() as db:
+        cursor = await db.execute(_UPDATE_OUTCOME_SQL, {
+            "contracts": contracts,
+            "lowest": lowest_price_reached,
+            "outcome": match_outcome,
+            "id": bet_id,
+        })
+        row = await cursor.fetchone()
 
-    return await get_bet_by_id(bet_id)
+    if row is None:
+        return None
+    bet = dict(row)
+    for col in _REAL_COLUMNS:
+        if bet[col] is not None:
+            bet[col] = float(bet[col])
+    return bet
 
 
 # ---------------------------------------------------------------------------
@@ -200,88 +178,121 @@ async def update_outcome(
 # ---------------------------------------------------------------------------
 
 async def get_bet_by_id(bet_id: int) -> Optional[dict]:
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cursor = await db.execute(
-            "SELECT * FROM tracked_bets WHERE id = ?", (bet_id,)
-        )
-        row = await cursor.fetchone()
-        return dict(row) if row else None
+    db = await get_conn()
+    cursor = await db.execute(
+        "SELECT * FROM tracked_bets WHERE id = ?", (bet_id,)
+    )
+    row = await cursor.fetchone()
+    return dict(row) if row else None
+
+
+BET_COLUMNS = (
+    "id", "event_ticker", "player_fav", "player_dog", "tournament",
+    "tournament_level", "surface", "fav_probability", "kalshi_price",
+    "target_price", "tracked_at", "contracts", "lowest_price_reached",
+    "match_outcome", "order_filled", "fill_price", "edge", "pnl", "status",
+)
 
 
-async def get_all_bets(status: Optional[str] = None) -> list[dict]:
+async def get_all_bets(
+    status: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    columns: tuple[str, ...] = BET_COLUMNS,
+) -> dict:
     """
     Return tracked bets, newest first.
     status filter: 'pending', 'completed', or None for all.
+    limit/cursor page through the results (no limit = every bet).
+    Returns {"rows": [...], "next_cursor": str | None}.
     """
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        if status:
-            cursor = await db.execute(
-                "SELECT * FROM tracked_bets WHERE status = ? ORDER BY tracked_at DESC",
-                (status,),
-            )
-        else:
-            cursor = await db.execute(
-                "SELECT * FROM tracked_bets ORDER BY tracked_at DESC"
-            )
-        rows = await cursor.fetchall()
-        return [dict(r) for r in rows]
+    where, params = ("status = ?", (status,)) if status else ("", ())
+    return await fetch_page(
+        "tracked_bets", "tracked_at", columns, BET_COLUMNS,
+        limit=limit, cursor=cursor, where=where, params=params,
+    )
 
 
 # ---------------------------------------------------------------------------
 # Stats — analytics over completed bets
 # ---------------------------------------------------------------------------
 
+# Shared aggregate columns for every stats grouping (computed by SQLite)
+_AGG_COLUMNS = """
+    COUNT(*)                                                                      AS count,
+    SUM(CASE WHEN order_filled THEN 1 ELSE 0 END)                                 AS filled,
+    SUM(CASE WHEN order_filled AND match_outcome = 'fav_won' THEN 1 ELSE 0 END)  AS won,
+    SUM(CASE WHEN order_filled AND match_outcome = 'fav_lost' THEN 1 ELSE 0 END) AS lost,
+    SUM(COALESCE(pnl, 0))                                                         AS pnl
+"""
+
+# fav_probability buckets (5% wide, stored as a percentage)
+_BUCKET_RANGES = [(70, 75), (75, 80), (80, 85), (85, 90), (90, 93)]
+_BUCKET_CASE = "CASE " + " ".join(
+    f"WHEN fav_probability >= {lo} AND fav_probability < {hi} THEN '{lo}-{hi}%'"
+    for lo, hi in _BUCKET_RANGES
+) + " END"
+
+_GROUP_FIELDS = ("tournament_level", "surface")
+
+
 async def get_stats() -> dict:
     """
     Compute analytics over all completed bets.
+    Aggregation runs in SQL — only per-group totals come back to Python.
     """
-    bets = await get_all_bets()
-    completed = [b for b in bets if b["status"] == "completed"]
-    pending = [b for b in bets if b["status"] == "pending"]
+    db = await get_conn()
+
+    cursor = await db.execute(
+        "SELECT status, COUNT(*) AS n FROM tracked_bets GROUP BY status"
+    )
+    by_status = {row["status"]: row["n"] for row in await cursor.fetchall()}
+    total_tracked = sum(by_status.values())
+    pending = by_status.get("pending", 0)
+    completed = by_status.get("completed", 0)
 
     if not completed:
         return {
-            "total_tracked": len(bets),
-            "pending": len(pending),
+            "total_tracked": total_tracked,
+            "pending": pending,
             "completed": 0,
             "message": "No completed bets yet.",
         }
 
-    filled = [b for b in completed if b["order_filled"]]
-    won = [b for b in filled if b["match_outcome"] == "fav_won"]
-    lost = [b for b in filled if b["match_outcome"] == "fav_lost"]
-    not_filled = [b for b in completed if not b["order_filled"]]
+    cursor = await db.execute(
+        f"SELECT {_AGG_COLUMNS}, AVG(edge) AS avg_edge"
+        " FROM tracked_bets WHERE status = 'completed'"
+    )
+    totals = await cursor.fetchone()
+    filled = totals["filled"]
+    won = totals["won"]
 
-    total_pnl = round(sum(b["pnl"] or 0 for b in completed), 2)
-    fill_rate = round(len(filled) / len(completed) * 100, 1) if completed else 0
-    win_rate = round(len(won) / len(filled) * 100, 1) if filled else 0
+    fill_rate = round(filled / completed * 100, 1)
+    win_rate = round(won / filled * 100, 1) if filled else 0
 
     # Breakdown by fav_probability bucket
-    buckets = _bucket_stats(completed)
+    buckets = await _bucket_stats(db)
 
     # Breakdown by tournament_level
-    by_level = _group_stats(completed, "tournament_level")
+    by_level = await _group_stats(db, "tournament_level")
 
     # Breakdown by surface
-    by_surface = _group_stats(completed, "surface")
+    by_surface = await _group_stats(db, "surface")
 
     # Average edge (positive = missed, negative = filled with margin)
-    edges = [b["edge"] for b in completed if b["edge"] is not None]
-    avg_edge = round(sum(edges) / len(edges), 1) if edges else None
+    avg_edge = round(totals["avg_edge"], 1) if totals["avg_edge"] is not None else None
 
     return {
-        "total_tracked": len(bets),
-        "pending": len(pending),
-        "completed": len(completed),
-        "filled": len(filled),
-        "not_filled": len(not_filled),
-        "won": len(won),
-        "lost": len(lost),
+        "total_tracked": total_tracked,
+        "pending": pending,
+        "completed": completed,
+        "filled": filled,
+        "not_filled": completed - filled,
+        "won": won,
+        "lost": totals["lost"],
         "fill_rate_pct": fill_rate,
         "win_rate_pct": win_rate,
-        "total_pnl": total_pnl,
+        "total_pnl": round(totals["pnl"], 2),
         "avg_edge_cents": avg_edge,
         "by_prob_bucket": buckets,
         "by_level": by_level,
@@ -289,57 +300,54 @@ async def get_stats() -> dict:
     }
 
 
-def _bucket_stats(bets: list[dict]) -> list[dict]:
-    """Group completed bets by fav_probability range (5% buckets)."""
-    bucket_ranges = [(70, 75), (75, 80), (80, 85), (85, 90), (90, 93)]
-    results = []
+def _format_group(row) -> dict:
+    """Turn one aggregate row into the stats dict shape used by the UI."""
+    return {
+        "count": row["count"],
+        "filled": row["filled"],
+        "won": row["won"],
+        "fill_rate_pct": round(row["filled"] / row["count"] * 100, 1),
+        "win_rate_pct": round(row["won"] / row["filled"] * 100, 1) if row["filled"] else 0,
+        "pnl": round(row["pnl"], 2),
+    }
 
-    for lo, hi in bucket_ranges:
-        group = [
-            b for b in bets
-            if b["fav_probability"] is not None and lo <= b["fav_probability"] < hi
-        ]
-        if not group:
-            continue
-
-        filled = [b for b in group if b["order_filled"]]
-        won = [b for b in filled if b["match_outcome"] == "fav_won"]
-        pnl = round(sum(b["pnl"] or 0 for b in group), 2)
-
-        results.append({
-            "bucket": f"{lo}-{hi}%",
-            "count": len(group),
-            "filled": len(filled),
-            "won": len(won),
-            "fill_rate_pct": round(len(filled) / len(group) * 100, 1),
-            "win_rate_pct": round(len(won) / len(filled) * 100, 1) if filled else 0,
-            "pnl": pnl,
-        })
 
+async def _bucket_stats(db) -> list[dict]:
+    """Group completed bets by fav_probability range (5% buckets)."""
+    cursor = await db.execute(
+        f"""
+        SELECT {_BUCKET_CASE} AS bucket, {_AGG_COLUMNS}
+        FROM tracked_bets
+        WHERE status = 'completed' AND fav_probability IS NOT NULL
+        GROUP BY bucket
+        HAVING bucket IS NOT NULL
+        """
+    )
+    rows = {row["bucket"]: row for row in await cursor.fetchall()}
+
+    results = []
+    for lo, hi in _BUCKET_RANGES:
+        label = f"{lo}-{hi}%"
+        if label in rows:
+            results.append({"bucket": label, **_format_group(rows[label])})
     return results
 
 
-def _group_stats(bets: list[dict], field: str) -> list[dict]:
+async def _group_stats(db, field: str) -> list[dict]:
     """Group completed bets by a categorical field and compute stats."""
-    groups: dict[str, list] = {}
-    for b in bets:
-        key = b.get(field) or "Unknown"
-        groups.setdefault(key, []).append(b)
-
-    results = []
-    for key, group in sorted(groups.items()):
-        filled = [b for b in group if b["order_filled"]]
-        won = [b for b in filled if b["match_outcome"] == "fav_won"]
-        pnl = round(sum(b["pnl"] or 0 for b in group), 2)
-
-        results.append({
-            "label": key,
-            "count": len(group),
-            "filled": len(filled),
-            "won": len(won),
-            "fill_rate_pct": round(len(filled) / len(group) * 100, 1),
-            "win_rate_pct": round(len(won) / len(filled) * 100, 1) if filled else 0,
-            "pnl": pnl,
-        })
-
-    return results
+    if field not in _GROUP_FIELDS:
+        raise ValueError(f"Cannot group stats by {field!r}")
+
+    cursor = await db.execute(
+        f"""
+        SELECT COALESCE(NULLIF({field}, ''), 'Unknown') AS label, {_AGG_COLUMNS}
+        FROM tracked_bets
+        WHERE status = 'completed'
+        GROUP BY label
+        ORDER BY label
+        """
+    )
+    return [
+        {"label": row["label"], **_format_group(row)}
+        for row in await cursor.fetchall()
+    ]
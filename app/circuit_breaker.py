@@ -0,0 +1,121 @@
+"""
+Circuit breaker — stops hammering an upstream API that is clearly down.
+
+During an outage every request would otherwise wait for its full timeout,
+so one automation cycle could take N × timeout. After FAILURE_THRESHOLD
+consecutive failures the breaker trips and calls are rejected immediately.
+
+States:
+  CLOSED     normal operation, consecutive failures are counted
+  OPEN       calls rejected with CircuitOpenError until RESET_SECONDS pass
+  HALF_OPEN  a single probe request is let through; success closes the
+             breaker, failure re-opens it for another RESET_SECONDS
+
+Config via env vars:
+  CIRCUIT_FAILURE_THRESHOLD=3   Consecutive failures before tripping (default: 3)
+  CIRCUIT_RESET_SECONDS=60      Seconds to stay open before probing (default: 60)
+"""
+
+import os
+import time
+import logging
+from enum import Enum
+from typing import Awaitable, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3"))
+RESET_SECONDS = float(os.getenv("CIRCUIT_RESET_SECONDS", "60"))
+
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one upstream service."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        reset_seconds: float = RESET_SECONDS,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.state_changed_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def _set_state(self, state: CircuitState):
+        if state != self.state:
+            logger.warning(f"Circuit '{self.name}': {self.state.value} → {state.value}")
+        self.state = state
+        self.state_changed_at = time.monotonic()
+
+    def allow_request(self) -> bool:
+        """True if a request may go out now (claims the probe slot when half-open)."""
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self.state_changed_at < self.reset_seconds:
+                return False
+            self._set_state(CircuitState.HALF_OPEN)
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        self._probe_in_flight = False
+        if self.state != CircuitState.CLOSED:
+            self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self):
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == CircuitState.HALF_OPEN or (
+            self.state == CircuitState.CLOSED and self.failures >= self.failure_threshold
+        ):
+            self._set_state(CircuitState.OPEN)
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn() through the breaker. Any exception raised by fn counts as
+        a failure and is re-raised; raises CircuitOpenError without calling
+        fn while the breaker is open.
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(f"{self.name} circuit open — skipping call")
+        try:
+            result = await fn()
+        except Exception:
+            self.record_failure()
+            raise
+        except BaseException:
+            # Cancellation says nothing about upstream health — just free the probe
+            self._probe_in_flight = False
+            raise
+        self.record_success()
+        return result
+
+    def snapshot(self) -> dict:
+        """Current state, for status endpoints."""
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.failures,
+            "failure_threshold": self.failure_threshold,
+            "reset_seconds": self.reset_seconds,
+        }
@@ -0,0 +1,157 @@
+"""
+SQLite connection shared by automation.py and bet_tracker.py (both use data/orders.db).
+
+The process keeps ONE long-lived aiosqlite connection instead of calling
+aiosqlite.connect() per query — each connect() spawns a worker thread,
+opens the file and re-applies PRAGMAs, and the page cache starts cold.
+
+  get_conn()     → the shared connection (opened lazily), for reads
+  transaction()  → async context manager for writes; serializes writers on
+                   the shared connection and commits (or rolls back) at exit
+  close_conn()   → called from main.py on shutdown
+  fetch_page()   → keyset-paginated, column-projected SELECT for list endpoints
+
+journal_mode=WAL is persistent (stored in the DB file), so setting it once at
+init is enough; the remaining PRAGMAs are per-connection and are applied when
+the shared connection is opened.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Optional
+
+import aiosqlite
+
+DB_PATH = Path(__file__).parent.parent / "data" / "orders.db"
+
+# WAL: commits append to the log instead of rewriting pages + fsync'ing a
+# rollback journal, and readers (dashboard/stats) no longer block the writer.
+# synchronous=NORMAL is durable across app crashes in WAL mode (only an OS
+# crash can lose the last commits).
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",   # 256 MB
+    "PRAGMA cache_size=-20000",     # ~20 MB page cache
+)
+
+_conn: Optional[aiosqlite.Connection] = None
+_open_lock = asyncio.Lock()
+# aiosqlite runs statements one at a time per connection, but a transaction
+# spans several awaits — without this two writers would interleave statements
+_write_lock = asyncio.Lock()
+
+
+async def apply_pragmas(db: aiosqlite.Connection):
+    """Apply the per-connection PRAGMAs."""
+    for pragma in CONNECTION_PRAGMAS:
+        await db.execute(pragma)
+
+
+async def enable_wal(db: aiosqlite.Connection):
+    """Switch the database to WAL mode (persistent)."""
+    await db.execute("PRAGMA journal_mode=WAL")
+
+
+async def get_conn() -> aiosqlite.Connection:
+    """Return the process-wide connection, opening it on first use."""
+    global _conn
+    if _conn is not None:
+        return _conn
+
+    async with _open_lock:
+        if _conn is None:
+            DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+            conn = await aiosqlite.connect(DB_PATH)
+            conn.row_factory = aiosqlite.Row
+            await apply_pragmas(conn)
+            _conn = conn
+    return _conn
+
+
+@asynccontextmanager
+async def transaction() -> AsyncIterator[aiosqlite.Connection]:
+    """Run a write transaction on the shared connection; commit on success."""
+    db = await get_conn()
+    async with _write_lock:
+        try:
+            yield db
+            await db.commit()
+        except BaseException:
+            await db.rollback()
+            raise
+
+
+async def close_conn():
+    """Close the shared connection (app shutdown)."""
+    global _conn
+    if _conn is not None:
+        await _conn.close()
+        _conn = None
+
+
+# ---------------------------------------------------------------------------
+# Keyset pagination
+# ---------------------------------------------------------------------------
+
+def _decode_cursor(cursor: str) -> tuple[str, int]:
+    """Cursor format is '<timestamp>|<id>' (as returned in next_cursor)."""
+    ts, sep, row_id = cursor.rpartition("|")
+    if not sep or not row_id.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return ts, int(row_id)
+
+
+async def fetch_page(
+    table: str,
+    time_column: str,
+    columns: Iterable[str],
+    allowed_columns: tuple[str, ...],
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    where: str = "",
+    params: tuple = (),
+) -> dict:
+    """
+    Newest-first page of `table`, selecting only `columns`.
+
+    Pages are keyed on (time_column, id) rather than OFFSET, so each page is an
+    index range scan; id breaks ties between rows written in the same cycle.
+    Returns {"rows": [...], "next_cursor": str | None}. Raises ValueError for
+    unknown columns or a malformed cursor.
+    """
+    cols = list(dict.fromkeys(columns))
+    unknown = [c for c in cols if c not in allowed_columns]
+    if unknown:
+        raise ValueError(f"Unknown column(s): {', '.join(unknown)}")
+    # The keyset columns are needed to build next_cursor
+    selected = cols + [c for c in ("id", time_column) if c not in cols]
+
+    conditions = [where] if where else []
+    args = list(params)
+    if cursor:
+        conditions.append(f"({time_column}, id) < (?, ?)")
+        args.extend(_decode_cursor(cursor))
+
+    sql = f"SELECT {', '.join(selected)} FROM {table}"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += f" ORDER BY {time_column} DESC, id DESC LIMIT ?"
+    args.append(limit if limit is not None else -1)
+
+    db = await get_conn()
+    cursor_ = await db.execute(sql, args)
+    rows = await cursor_.fetchall()
+
+    next_cursor = None
+    if limit is not None and len(rows) == limit:
+        last = rows[-1]
+        next_cursor = f"{last[time_column]}|{last['id']}"
+
+    extra = set(selected) - set(cols)
+    result = [
+        {k: row[k] for k in cols} if extra else dict(row)
+        for row in rows
+    ]
+    return {"rows": result, "next_cursor": next_cursor}
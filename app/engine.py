@@ -10,6 +10,8 @@ System:
   Various conditions → SKIP
 """
 
+from operator import attrgetter
+
 from app.models import (
     MatchData, AnalysisResult, Signal,
     TournamentLevel, Surface,
@@ -37,8 +39,17 @@ MIN_FAVORITE_PCT = 0.70
 MAX_FAVORITE_PCT = 0.92
 MIN_VOLUME = 100
 
+# Skip filters, in the order they are checked (first failing filter wins).
+# The order decides the skip_reason shown on the dashboard, so Grand Slam
+# comes first as it always has; the BUY-only trading loop in _partition
+# builds no reasons and checks the probability floor first instead.
+_SKIP_GRAND_SLAM, _SKIP_FAV_LOW, _SKIP_FAV_HIGH, _SKIP_LOW_VOLUME = range(4)
 
-def calculate_factor(
+# Sort key for BUYs (tightest spread first) — C-level getter, no per-element lambda
+_BY_EDGE = attrgetter("edge")
+
+
+def _compute_factor(
     tournament: TournamentLevel,
     surface: Surface,
 ) -> float:
@@ -49,44 +60,57 @@ def calculate_factor(
     return round(factor, 2)
 
 
-def analyze_match(match: MatchData) -> AnalysisResult:
-    """
-    Run the full decision engine on a single match.
-    TARGET = the limit order price to set on Kalshi.
-    If match passes filters → BUY (place limit order at TARGET).
-    """
+# Only len(TournamentLevel) × len(Surface) combinations exist — precompute them all.
+# Nested (level → surface → factor) rather than tuple-keyed: two lookups on
+# the enums' cached str hashes, no tuple to build and hash per lookup.
+_FACTOR_TABLE: dict[TournamentLevel, dict[Surface, float]] = {
+    tournament: {surface: _compute_factor(tournament, surface) for surface in Surface}
+    for tournament in TournamentLevel
+}
 
-    # --- Filters (SKIP conditions) ---
-    if match.tournament_level == TournamentLevel.GRAND_SLAM:
-        return AnalysisResult(
-            match=match, signal=Signal.SKIP,
-            target_price=None, factor=None,
-            skip_reason="Grand Slam — not traded",
-        )
-
-    if match.fav_probability < MIN_FAVORITE_PCT:
-        return AnalysisResult(
-            match=match, signal=Signal.SKIP,
-            target_price=None, factor=None,
-            skip_reason=f"Favorite {match.fav_probability*100:.0f}% < {MIN_FAVORITE_PCT*100:.0f}% minimum",
-        )
-
-    if match.fav_probability > MAX_FAVORITE_PCT:
-        return AnalysisResult(
-            match=match, signal=Signal.SKIP,
-            target_price=None, factor=None,
-            skip_reason=f"Favorite {match.fav_probability*100:.0f}% > {MAX_FAVORITE_PCT*100:.0f}% maximum",
-        )
 
+def calculate_factor(
+    tournament: TournamentLevel,
+    surface: Surface,
+) -> float:
+    """Return the multiplier factor (base + adjustments) for a tournament/surface."""
+    return _FACTOR_TABLE[tournament][surface]
+
+
+def _first_failed_filter(match: MatchData) -> int | None:
+    """Return the code of the first SKIP filter this match fails, or None."""
+    if match.tournament_level == TournamentLevel.GRAND_SLAM:
+        return _SKIP_GRAND_SLAM
+    fav_probability = match.fav_probability
+    if fav_probability < MIN_FAVORITE_PCT:
+        return _SKIP_FAV_LOW
+    if fav_probability > MAX_FAVORITE_PCT:
+        return _SKIP_FAV_HIGH
     if match.volume < MIN_VOLUME:
-        return AnalysisResult(
-            match=match, signal=Signal.SKIP,
-            target_price=None, factor=None,
-            skip_reason=f"Volume ${match.volume:,.0f} < ${MIN_VOLUME:,.0f} minimum",
-        )
+        return _SKIP_LOW_VOLUME
+    return None
 
-    # --- Calculate target (limit order price) ---
-    factor = calculate_factor(match.tournament_level, match.surface)
+
+def _skip_result(match: MatchData, code: int) -> AnalysisResult:
+    """Build the SKIP result for a failed filter."""
+    if code == _SKIP_GRAND_SLAM:
+        reason = "Grand Slam — not traded"
+    elif code == _SKIP_FAV_LOW:
+        reason = f"Favorite {match.fav_probability*100:.0f}% < {MIN_FAVORITE_PCT*100:.0f}% minimum"
+    elif code == _SKIP_FAV_HIGH:
+        reason = f"Favorite {match.fav_probability*100:.0f}% > {MAX_FAVORITE_PCT*100:.0f}% maximum"
+    else:
+        reason = f"Volume ${match.volume:,.0f} < ${MIN_VOLUME:,.0f} minimum"
+
+    return AnalysisResult(
+        match=match, signal=Signal.SKIP,
+        target_price=None, factor=None,
+        skip_reason=reason,
+    )
+
+
+def _buy_result(match: MatchData, factor: float) -> AnalysisResult:
+    """Build the BUY result: target (limit order price) and edge for a passing match."""
     target = round(match.fav_probability * factor, 2)
 
     # Edge = how far the current market is from our limit order
@@ -103,9 +127,70 @@ def analyze_match(match: MatchData) -> AnalysisResult:
     )
 
 
+def analyze_match(match: MatchData) -> AnalysisResult:
+    """
+    Run the full decision engine on a single match.
+    TARGET = the limit order price to set on Kalshi.
+    If match passes filters → BUY (place limit order at TARGET).
+    """
+
+    # --- Filters (SKIP conditions) ---
+    code = _first_failed_filter(match)
+    if code is not None:
+        return _skip_result(match, code)
+
+    # --- Calculate target (limit order price) ---
+    # Factor only looked up once every filter has passed
+    return _buy_result(match, _FACTOR_TABLE[match.tournament_level][match.surface])
+
+
+def _partition(
+    matches: list[MatchData],
+    include_skips: bool = True,
+) -> tuple[list[AnalysisResult], list[AnalysisResult]]:
+    """
+    Split a batch into (BUYs sorted by tightest spread, SKIPs in input order).
+    Partitioning instead of sorting the whole batch: SKIPs (the vast majority)
+    keep input order, only the handful of BUYs need sorting by edge.
+    With include_skips=False no SKIP results are built at all.
+    """
+    # Hot loop: index the factor table directly rather than via calculate_factor()
+    factor_table = _FACTOR_TABLE
+    buys, skips = [], []
+    if include_skips:
+        for m in matches:
+            code = _first_failed_filter(m)
+            if code is None:
+                buys.append(_buy_result(m, factor_table[m.tournament_level][m.surface]))
+            else:
+                skips.append(_skip_result(m, code))
+    else:
+        # No skip reason needed → the filters collapse into one short-circuiting
+        # condition, inlined to save a function call per (mostly rejected) match.
+        # Same comparisons as _first_failed_filter, so NaN/edge values agree.
+        min_fav, max_fav, min_volume = MIN_FAVORITE_PCT, MAX_FAVORITE_PCT, MIN_VOLUME
+        grand_slam = TournamentLevel.GRAND_SLAM
+        for m in matches:
+            fav_probability = m.fav_probability
+            if (
+                fav_probability < min_fav
+                or fav_probability > max_fav
+                or m.volume < min_volume
+                or m.tournament_level == grand_slam
+            ):
+                continue
+            buys.append(_buy_result(m, factor_table[m.tournament_level][m.surface]))
+    buys.sort(key=_BY_EDGE)
+    return buys, skips
+
+
 def analyze_all(matches: list[MatchData]) -> list[AnalysisResult]:
     """Analyze a batch of matches. BUY first (sorted by tightest spread), then SKIP."""
-    results = [analyze_match(m) for m in matches]
-    order = {Signal.BUY: 0, Signal.WAIT: 1, Signal.SKIP: 2}
-    results.sort(key=lambda r: (order.get(r.signal, 3), r.edge if r.edge is not None else 999))
-    return results
+    buys, skips = _partition(matches)
+    return buys + skips
+
+
+def analyze_for_trading(matches: list[MatchData]) -> list[AnalysisResult]:
+    """BUY results only, sorted by tightest spread — the automation hot path."""
+    buys, _ = _partition(matches, include_skips=False)
+    return buys
@@ -0,0 +1,38 @@
+"""
+Shared httpx.AsyncClient per upstream API (used by kalshi_client.py and
+matchstat_client.py).
+
+Each client module keeps ONE pooled client for the whole process instead of
+opening one per request, so kept-alive connections (and their TLS sessions)
+are reused. Pooled connections belong to the event loop that opened them: in
+the server there is one loop for the process lifetime, but callers that go
+through asyncio.run() (scripts) get a fresh client per loop.
+"""
+
+import asyncio
+from typing import Callable, Optional
+
+import httpx
+
+
+class LoopBoundClient:
+    """An AsyncClient built by `factory` on first use, rebuilt when the running loop changes."""
+
+    def __init__(self, factory: Callable[[], httpx.AsyncClient]):
+        self._factory = factory
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the client for the running loop. Must be called from a coroutine."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            self._client = self._factory()
+            self._loop = loop
+        return self._client
+
+    async def aclose(self):
+        """Close the client (app shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = self._loop = None
@@ -4,6 +4,8 @@ Kalshi API client — fetches live tennis markets and prices.
 Kalshi v2 API docs: https://docs.kalshi.com
 Authentication: RSA-PSS signature with SHA256.
 Headers: KALSHI-ACCESS-KEY, KALSHI-ACCESS-SIGNATURE, KALSHI-ACCESS-TIMESTAMP
+A signature covers only timestamp + method + path, so one is reused for every
+request to the same endpoint within KALSHI_SIGNATURE_REUSE_MS (default 500).
 
 Kalshi market price fields:
   - yes_bid / yes_ask: current order book (what you can buy/sell at)
@@ -14,15 +16,26 @@ Kalshi market price fields:
 
 import os
 import re
+import time
+import random
 import base64
-import datetime
+import asyncio
+import logging
+import functools
+import itertools
 import httpx
-from typing import Optional
+import orjson
+from pathlib import Path
+from typing import AsyncIterator, Optional
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 from app.models import MatchData, PlayerInfo, TournamentLevel, Surface
+from app.tennis_data import load_tournament_db
+from app.http_client import LoopBoundClient
 
 
+logger = logging.getLogger(__name__)
+
 KALSHI_BASE_URL = os.getenv("KALSHI_BASE_URL", "https://api.elections.kalshi.com/trade-api/v2")
 KALSHI_API_KEY = os.getenv("KALSHI_API_KEY", "")
 KALSHI_API_SECRET = os.getenv("KALSHI_API_SECRET", "")
@@ -33,10 +46,63 @@ _FALLBACK_SERIES = ["KXATPMATCH", "KXWTAMATCH"]
 # Cache for dynamically discovered tennis series tickers
 _tennis_series_cache: list[str] = []
 _tennis_series_cache_ts: float = 0
+_tennis_series_cache_ttl: float = 0
 _SERIES_CACHE_TTL = 3600  # re-discover every 1 hour
+_SERIES_RETRY_TTL = 300   # after a failed discovery, retry in 5 min
+# Last list that came from an actual discovery (not _FALLBACK_SERIES)
+_last_discovered_series: list[str] = []
+
+# Successful discoveries are also written here (data/ is the persisted volume),
+# so a restarted worker reuses them instead of re-running discovery
+SERIES_CACHE_PATH = Path(__file__).parent.parent / "data" / "kalshi_series.json"
+_series_file_checked = False
+
+# Signatures are reused for requests to the same endpoint within this window
+# (ms); the timestamp sent is at most this stale. 0 = sign every request.
+SIGNATURE_REUSE_MS = int(os.getenv("KALSHI_SIGNATURE_REUSE_MS", "500"))
+
+# At most this many Kalshi GETs in flight at once (series × prefetched pages
+# would otherwise fan out unbounded and run into the rate limit)
+MAX_CONCURRENT_REQUESTS = int(os.getenv("KALSHI_MAX_CONCURRENCY", "8"))
+# A 429 is retried this many times, waiting Retry-After (or backing off)
+MAX_429_RETRIES = 3
+# GET bodies are reused for this many seconds without asking Kalshi again
+# (0 = off) — a dashboard refresh right after a fetch cycle costs no requests.
+# Only reads go through _kalshi_get; orders are never cached.
+RESPONSE_CACHE_TTL = float(os.getenv("KALSHI_CACHE_TTL", "10"))
+
+# Idle pooled connections are kept this long (s). httpx's 5 s default let the
+# connection lapse between the market fetch and the order POSTs that follow
+# Matchstat enrichment; 60 s matches common load-balancer idle timeouts.
+KEEPALIVE_EXPIRY = 60.0
+
+# Markets per /markets page — Kalshi's maximum, so a series is one round trip
+# until it has more than this many open markets
+MARKETS_PAGE_LIMIT = 1000
+
+# Kalshi responses at least this large are JSON-decoded in a worker thread
+# (bytes, 0 = always). A full /markets page is ~1-2 MB, so a whole body is
+# small enough that streaming/incremental parsing buys nothing over this.
+JSON_OFFLOAD_BYTES = int(os.getenv("KALSHI_JSON_OFFLOAD_BYTES", str(1024 * 1024)))
 
 _private_key = None
 
+# The request-slot semaphore belongs to the event loop that created it
+_request_slots: Optional[asyncio.Semaphore] = None
+_request_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Last ETag + raw body per (path, params): a 304 reply to If-None-Match is
+# answered from here. Bytes, not the decoded dict — callers mutate what
+# _kalshi_get returns. Oldest entries are dropped past _BODY_CACHE_MAX
+# (cursor values make the key space open-ended).
+_etag_cache: dict[tuple, tuple[str, bytes]] = {}
+# (time.monotonic() expiry, raw body) per key, for RESPONSE_CACHE_TTL
+_response_cache: dict[tuple, tuple[float, bytes]] = {}
+_BODY_CACHE_MAX = 256
+# In-flight GETs by the same (path, params) key: concurrent callers asking
+# for the same thing await one request instead of each sending their own
+_inflight: dict[tuple, asyncio.Task] = {}
+
 
 def _load_private_key():
     """Load RSA private key from the KALSHI_API_SECRET env var."""
@@ -53,31 +119,105 @@ def _load_private_key():
     return _private_key
 
 
-def _sign_request(method: str, path: str, timestamp: str) -> str:
-    """Sign a Kalshi API request using RSA-PSS with SHA256."""
+async def warmup():
+    """
+    Parse the private key at app startup (in a worker thread) so the first
+    signed request doesn't stall the event loop on PEM/RSA key loading.
+    A bad key is logged here, at boot, rather than on the first order.
+    """
+    if not KALSHI_API_SECRET:
+        logger.warning("KALSHI_API_SECRET not set — Kalshi requests will fail")
+        return
+    try:
+        await asyncio.to_thread(_load_private_key)
+        logger.info("Kalshi private key loaded")
+    except Exception as e:
+        logger.error(f"Invalid KALSHI_API_SECRET — could not load private key: {e}")
+
+
+def _new_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=True,
+        # Keep-alive pool sized to the GET concurrency cap; the extra
+        # headroom is for order POSTs, which don't take a request slot
+        limits=httpx.Limits(
+            max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+            max_connections=MAX_CONCURRENT_REQUESTS * 2,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+        timeout=15.0,
+    )
+
+
+# One pooled client for the whole process: a fresh AsyncClient per fetch cycle
+# paid a new TCP + TLS handshake every time. HTTP/2 lets the concurrent series
+# pagination share a single connection.
+_client = LoopBoundClient(_new_client)
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared Kalshi HTTP client (see app/http_client.py)."""
+    return _client.get()
+
+
+async def close_client():
+    """Close the shared client (app shutdown)."""
+    await _client.aclose()
+
+
+# RSA-PSS padding and the hash algorithm are stateless — build them once
+# instead of per signature
+_SHA256 = hashes.SHA256()
+_PSS_PADDING = padding.PSS(
+    mgf=padding.MGF1(_SHA256),
+    salt_length=padding.PSS.DIGEST_LENGTH,
+)
+
+
+def _sign_request(method: str, path_without_query: str, timestamp: str) -> str:
+    """
+    Sign a Kalshi API request using RSA-PSS with SHA256.
+    The path must already be stripped of its query string (_auth_headers does it).
+    """
     private_key = _load_private_key()
     if not private_key:
         raise ValueError("Kalshi private key not configured")
 
-    path_without_query = path.split("?")[0]
+    # One f-string + one encode (the RSA sign below dominates either way)
     message = f"{timestamp}{method}{path_without_query}".encode("utf-8")
 
-    signature = private_key.sign(
-        message,
-        padding.PSS(
-            mgf=padding.MGF1(hashes.SHA256()),
-            salt_length=padding.PSS.DIGEST_LENGTH,
-        ),
-        hashes.SHA256(),
-    )
+    signature = private_key.sign(message, _PSS_PADDING, _SHA256)
 
     return base64.b64encode(signature).decode("utf-8")
 
 
+@functools.lru_cache(maxsize=64)
+def _signed_timestamp(method: str, path_without_query: str, bucket: int) -> tuple[str, str]:
+    """
+    (timestamp, signature) for one SIGNATURE_REUSE_MS window.
+    The signature only covers timestamp + method + path, so every request to
+    the same endpoint within the window can reuse it — a paginated burst pays
+    for one RSA signature instead of one per page.
+    """
+    timestamp = str(bucket * SIGNATURE_REUSE_MS)
+    return timestamp, _sign_request(method, path_without_query, timestamp)
+
+
 def _auth_headers(method: str, path: str) -> dict:
-    """Build authenticated headers for a Kalshi API request."""
-    timestamp = str(int(datetime.datetime.now().timestamp() * 1000))
-    signature = _sign_request(method, path, timestamp)
+    """
+    Build authenticated headers for a Kalshi API request.
+    Signs inline: with signature reuse a whole fetch fan-out shares one
+    RSA sign, cheaper than an asyncio.to_thread round trip.
+    """
+    now_ms = time.time_ns() // 1_000_000
+    path_without_query = path.split("?", 1)[0]
+    if SIGNATURE_REUSE_MS > 0:
+        timestamp, signature = _signed_timestamp(
+            method, path_without_query, now_ms // SIGNATURE_REUSE_MS
+        )
+    else:
+        timestamp = str(now_ms)
+        signature = _sign_request(method, path_without_query, timestamp)
 
     return {
         "KALSHI-ACCESS-KEY": KALSHI_API_KEY,
@@ -87,35 +227,209 @@ def _auth_headers(method: str, path: str) -> dict:
     }
 
 
+def _get_request_slots() -> asyncio.Semaphore:
+    """Semaphore bounding concurrent Kalshi GETs on the running loop."""
+    global _request_slots, _request_slots_loop
+    loop = asyncio.get_running_loop()
+    if _request_slots is None or _request_slots_loop is not loop:
+        _request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        _request_slots_loop = loop
+    return _request_slots
+
+
+def _retry_delay(resp: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a 429: Retry-After if given, else jittered backoff."""
+    try:
+        return min(float(resp.headers["Retry-After"]), 10.0)
+    except (KeyError, ValueError):
+        return 0.5 * 2 ** attempt + random.uniform(0, 0.25)
+
+
 async def _kalshi_get(client: httpx.AsyncClient, path: str, params: dict = None) -> dict:
-    """Make an authenticated GET request to Kalshi API."""
+    """
+    Make an authenticated GET request to Kalshi API.
+    A body fetched within RESPONSE_CACHE_TTL seconds is reused, and identical
+    requests already in flight are joined rather than repeated; each caller
+    still gets its own decoded dict (callers mutate the result).
+    """
+    key = (path, tuple(sorted(params.items())) if params else ())
+    fresh = _response_cache.get(key)
+    if fresh and fresh[0] > time.monotonic():
+        content = fresh[1]
+    else:
+        task = _inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(_kalshi_fetch_body(client, path, params, key))
+            _inflight[key] = task
+
+            def _forget(done: asyncio.Task):
+                if _inflight.get(key) is done:
+                    del _inflight[key]
+                # Awaiters get the error through shield(); if they were all
+                # cancelled nobody would, and asyncio would log it as unretrieved
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(_forget)
+
+        # shield: one caller being cancelled must not cancel the shared request
+        content = await asyncio.shield(task)
+
+    # Typical bodies decode in about a millisecond — only unusually large
+    # ones are worth the hop to a worker thread
+    if len(content) >= JSON_OFFLOAD_BYTES:
+        return await asyncio.to_thread(orjson.loads, content)
+    return orjson.loads(content)
+
+
+async def _kalshi_fetch_body(
+    client: httpx.AsyncClient,
+    path: str,
+    params: Optional[dict],
+    cache_key: tuple,
+) -> bytes:
+    """
+    The raw response body of one GET (for _kalshi_get).
+    At most MAX_CONCURRENT_REQUESTS run at once; a 429 is retried up to
+    MAX_429_RETRIES times (the wait happens outside the concurrency slot).
+    Sends If-None-Match when an earlier response had an ETag, and reuses the
+    cached body on 304.
+    """
     url = f"{KALSHI_BASE_URL}{path}"
-    headers = _auth_headers("GET", f"/trade-api/v2{path}")
-
-    resp = await client.get(url, headers=headers, params=params, timeout=15.0)
-    resp.raise_for_status()
-    return resp.json()
+    cached = _etag_cache.get(cache_key)
+
+    for attempt in range(MAX_429_RETRIES + 1):
+        # Signed per attempt — a reused timestamp could be stale after a wait
+        headers = _auth_headers("GET", f"/trade-api/v2{path}")
+        if cached:
+            headers["If-None-Match"] = cached[0]
+        async with _get_request_slots():
+            resp = await client.get(url, headers=headers, params=params)
+        if resp.status_code != 429 or attempt == MAX_429_RETRIES:
+            break
+        delay = _retry_delay(resp, attempt)
+        logger.warning(f"Kalshi rate limit on {path} — retry {attempt + 1}/{MAX_429_RETRIES} in {delay:.1f}s")
+        await asyncio.sleep(delay)
 
+    if resp.status_code == 304 and cached:
+        content = cached[1]
+    else:
+        resp.raise_for_status()
+        content = resp.content
+        etag = resp.headers.get("ETag")
+        if etag:
+            _put_bounded(_etag_cache, cache_key, (etag, content))
+    if RESPONSE_CACHE_TTL > 0:
+        _put_bounded(_response_cache, cache_key, (time.monotonic() + RESPONSE_CACHE_TTL, content))
+    return content
+
+
+def _put_bounded(cache: dict, key: tuple, value: tuple):
+    """Insert as the newest entry, dropping the oldest past _BODY_CACHE_MAX."""
+    cache.pop(key, None)
+    if len(cache) >= _BODY_CACHE_MAX:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+async def _kalshi_iter_pages(
+    client: httpx.AsyncClient,
+    path: str,
+    params: dict,
+    key: str = "markets",
+    max_pages: int = 10,
+) -> AsyncIterator[list[dict]]:
+    """
+    Paginated fetch as an async generator — yields each page's items.
 
-async def _kalshi_get_all(client: httpx.AsyncClient, path: str, params: dict, key: str = "markets") -> list[dict]:
-    """Paginated fetch — gets all results using cursor."""
-    all_items = []
-    cursor = None
+    Kalshi cursors are chained (page k+1 needs page k's cursor) and responses
+    carry no total count, so pages can't be requested in parallel; instead the
+    next page is already in flight while the caller processes the current one.
+    A page shorter than params["limit"] is the last one, even if it still
+    carries a cursor — no request is spent fetching an empty page.
+    """
+    page_size = params.get("limit")
 
-    for _ in range(10):  # max 10 pages
+    async def _fetch(cursor: Optional[str]) -> dict:
         p = dict(params)
         if cursor:
             p["cursor"] = cursor
+        return await _kalshi_get(client, path, params=p)
 
-        data = await _kalshi_get(client, path, params=p)
-        items = data.get(key, [])
-        all_items.extend(items)
+    pending: Optional[asyncio.Future] = asyncio.ensure_future(_fetch(None))
+    try:
+        for page in range(max_pages):
+            data = await pending
+            pending = None
+            items = data.get(key, [])
+
+            cursor = data.get("cursor")
+            more = bool(items) and (page_size is None or len(items) >= page_size)
+            if cursor and more and page + 1 < max_pages:
+                pending = asyncio.ensure_future(_fetch(cursor))
+
+            yield items
+            if pending is None:
+                break
+    finally:
+        # Caller stopped early (or errored) — don't leave a request dangling
+        if pending is not None:
+            pending.cancel()
 
-        cursor = data.get("cursor")
-        if not cursor or len(items) == 0:
-            break
 
-    return all_items
+async def _kalshi_get_all(client: httpx.AsyncClient, path: str, params: dict, key: str = "markets") -> list[dict]:
+    """Paginated fetch — gets all results using cursor (max 10 pages)."""
+    return [item async for page in _kalshi_iter_pages(client, path, params, key) for item in page]
+
+
+def _load_series_cache_file(now: float):
+    """
+    Seed the in-memory series cache from SERIES_CACHE_PATH (once per process).
+    A file older than _SERIES_CACHE_TTL only seeds the stale fallback.
+    """
+    global _tennis_series_cache, _tennis_series_cache_ts, _tennis_series_cache_ttl
+    global _last_discovered_series, _series_file_checked
+
+    _series_file_checked = True
+    try:
+        saved = orjson.loads(SERIES_CACHE_PATH.read_bytes())
+        ts, series = float(saved["ts"]), [str(s) for s in saved["series"]]
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable {SERIES_CACHE_PATH.name}: {e}")
+        return
+    if not series:
+        return
+
+    _last_discovered_series = series
+    if now - ts < _SERIES_CACHE_TTL:
+        _tennis_series_cache = series
+        _tennis_series_cache_ts = ts
+        _tennis_series_cache_ttl = _SERIES_CACHE_TTL
+
+
+def _save_series_cache_file(series: list[str], ts: float):
+    """Persist a successful discovery; failures only cost the next restart a rediscovery."""
+    try:
+        SERIES_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        SERIES_CACHE_PATH.write_bytes(orjson.dumps({"ts": ts, "series": series}))
+    except OSError as e:
+        logger.warning(f"Could not write {SERIES_CACHE_PATH.name}: {e}")
+
+
+def _log_discovery_error(step: str, error: Exception):
+    """
+    Discovery is best-effort (it falls back to known series), so a failed step
+    never aborts it — but it is no longer silent. HTTP and decode errors
+    (orjson raises ValueError, as does a missing private key) are expected
+    outages; anything else means the response shape changed or the parsing is
+    wrong, and is logged with its traceback.
+    """
+    if isinstance(error, (httpx.HTTPError, ValueError)):
+        logger.warning(f"Series discovery: {step} failed: {error}")
+    else:
+        logger.error(f"Series discovery: unexpected error in {step}: {error!r}", exc_info=error)
 
 
 async def _discover_tennis_series(client: httpx.AsyncClient) -> list[str]:
@@ -128,20 +442,29 @@ async def _discover_tennis_series(client: httpx.AsyncClient) -> list[str]:
     3. GET /series?category=...&tags=... — fetch all tennis series
     4. Fallback to known tickers if discovery fails
 
-    Results are cached for 1 hour.
+    Results are cached for 1 hour, in memory and in SERIES_CACHE_PATH (so
+    restarts reuse them). If discovery finds nothing (endpoints down), the last
+    successful discovery is served stale — or the fallback tickers if there is
+    none yet — and discovery is retried after 5 minutes.
     """
-    import time
-    global _tennis_series_cache, _tennis_series_cache_ts
+    global _tennis_series_cache, _tennis_series_cache_ts, _tennis_series_cache_ttl
+    global _last_discovered_series
 
     now = time.time()
-    if _tennis_series_cache and (now - _tennis_series_cache_ts) < _SERIES_CACHE_TTL:
+    if not _series_file_checked:
+        _load_series_cache_file(now)
+    if _tennis_series_cache and (now - _tennis_series_cache_ts) < _tennis_series_cache_ttl:
         return _tennis_series_cache
 
     discovered = set()
 
+    # Steps 1 and 2 don't depend on each other — both requests go out now
+    filters_req = asyncio.ensure_future(_kalshi_get(client, "/search/filters_by_sport"))
+    tags_req = asyncio.ensure_future(_kalshi_get(client, "/search/tags_by_categories"))
+
     # Step 1: Use /search/filters_by_sport to find tennis competitions
     try:
-        data = await _kalshi_get(client, "/search/filters_by_sport")
+        data = await filters_req
         filters = data.get("filters_by_sports", {})
 
         # Match "Tennis" exactly — NOT "Table Tennis"
@@ -156,30 +479,29 @@ async def _discover_tennis_series(client: httpx.AsyncClient) -> list[str]:
             # competitions can be a dict (name -> data) or a list
             competitions = tennis_filters.get("competitions", {})
             if isinstance(competitions, dict):
-                for comp_name, comp_data in competitions.items():
-                    if isinstance(comp_data, dict):
-                        for scope in comp_data.get("scopes", []):
-                            if isinstance(scope, str) and scope.startswith("KX"):
-                                discovered.add(scope)
-            elif isinstance(competitions, list):
-                for comp in competitions:
-                    if isinstance(comp, dict):
-                        for scope in comp.get("scopes", []):
-                            if isinstance(scope, str) and scope.startswith("KX"):
-                                discovered.add(scope)
-
-            # Also check top-level scopes
-            for scope in tennis_filters.get("scopes", []):
-                if isinstance(scope, str) and scope.startswith("KX"):
-                    discovered.add(scope)
-    except Exception:
-        pass
+                competitions = competitions.values()
+            elif not isinstance(competitions, list):
+                competitions = ()
+
+            # Competition scopes plus the top-level scopes, in one pass
+            scopes = itertools.chain(
+                itertools.chain.from_iterable(
+                    comp.get("scopes", ()) for comp in competitions if isinstance(comp, dict)
+                ),
+                tennis_filters.get("scopes", ()),
+            )
+            discovered.update(
+                scope for scope in scopes
+                if isinstance(scope, str) and scope.startswith("KX")
+            )
+    except Exception as e:
+        _log_discovery_error("filters_by_sport", e)
 
     # Step 2: Use /search/tags_by_categories to find the right category/tags for tennis
     tennis_category = None
     tennis_tags = []
     try:
-        data = await _kalshi_get(client, "/search/tags_by_categories")
+        data = await tags_req
         tags_by_cat = data.get("tags_by_categories", {})
 
         for cat_name, tags in tags_by_cat.items():
@@ -190,26 +512,32 @@ async def _discover_tennis_series(client: httpx.AsyncClient) -> list[str]:
                     continue
                 tag_lower = tag.lower().strip()
                 # Match "Tennis" but not "Table Tennis"
-                if tag_lower == "tennis" or tag_lower.startswith("atp") or tag_lower.startswith("wta"):
+                if tag_lower == "tennis" or tag_lower.startswith(("atp", "wta")):
                     tennis_category = cat_name
                     tennis_tags.append(tag)
-    except Exception:
-        pass
+    except Exception as e:
+        _log_discovery_error("tags_by_categories", e)
 
-    # Step 3: Fetch series using discovered category/tags
+    # Step 3: Fetch series using discovered category/tags (one request per tag, concurrently)
     if tennis_tags:
-        for tag in tennis_tags:
-            try:
-                params = {"tags": tag}
-                if tennis_category:
-                    params["category"] = tennis_category
-                data = await _kalshi_get(client, "/series", params=params)
-                for s in data.get("series", []):
-                    ticker = s.get("ticker", "")
-                    if ticker:
-                        discovered.add(ticker)
-            except Exception:
-                pass
+        async def _series_for_tag(tag: str) -> list[str]:
+            params = {"tags": tag}
+            if tennis_category:
+                params["category"] = tennis_category
+            data = await _kalshi_get(client, "/series", params=params)
+            return [s.get("ticker", "") for s in data.get("series", [])]
+
+        results = await asyncio.gather(
+            *(_series_for_tag(tag) for tag in tennis_tags),
+            return_exceptions=True,
+        )
+        for tag, tickers in zip(tennis_tags, results):
+            if isinstance(tickers, Exception):
+                _log_discovery_error(f"series(tags={tag})", tickers)
+                continue
+            if isinstance(tickers, BaseException):
+                raise tickers
+            discovered.update(t for t in tickers if t)
 
     # Step 4: Also try fetching series with category alone if we found one
     if tennis_category and not discovered:
@@ -220,19 +548,47 @@ async def _discover_tennis_series(client: httpx.AsyncClient) -> list[str]:
                 title = s.get("title", "").lower()
                 if ticker and ("tennis" in title or "atp" in title or "wta" in title or "match" in title):
                     discovered.add(ticker)
-        except Exception:
-            pass
+        except Exception as e:
+            _log_discovery_error(f"series(category={tennis_category})", e)
 
-    # Use discovered tickers, or fallback
+    # Use discovered tickers, or the last good discovery / fallback until the retry
     if discovered:
-        _tennis_series_cache = list(discovered)
+        _tennis_series_cache = _last_discovered_series = list(discovered)
+        _tennis_series_cache_ttl = _SERIES_CACHE_TTL
+        _save_series_cache_file(_tennis_series_cache, now)
     else:
-        _tennis_series_cache = list(_FALLBACK_SERIES)
+        _tennis_series_cache = _last_discovered_series or list(_FALLBACK_SERIES)
+        _tennis_series_cache_ttl = _SERIES_RETRY_TTL
+        logger.warning(
+            f"Tennis series discovery found nothing — using "
+            f"{'last discovered' if _last_discovered_series else 'fallback'} series, "
+            f"retrying in {_SERIES_RETRY_TTL}s"
+        )
 
     _tennis_series_cache_ts = now
     return _tennis_series_cache
 
 
+# (discovered list it was built from, its MATCH series)
+_match_series_cache: tuple[Optional[list[str]], list[str]] = (None, [])
+
+
+def _match_series(all_series: list[str]) -> list[str]:
+    """
+    For trading, only fetch match-winner markets (MATCH series) — this filters
+    out game markets, futures, field markets, etc. Falls back to the known
+    tickers if none match. Filtered once per discovery result (the discovery
+    cache returns the same list for an hour), not on every fetch; debug_fetch
+    still sees every discovered series.
+    """
+    global _match_series_cache
+    source, match_series = _match_series_cache
+    if source is not all_series:
+        match_series = [s for s in all_series if "MATCH" in s] or list(_FALLBACK_SERIES)
+        _match_series_cache = (all_series, match_series)
+    return match_series
+
+
 def _get_market_price(market: dict) -> Optional[int]:
     """
     Extract the best available price from a Kalshi market.
@@ -271,55 +627,83 @@ async def fetch_tennis_markets(
     """
     tournament_db = tournament_db or {}
 
-    async with httpx.AsyncClient() as client:
-        # Dynamically discover all tennis series tickers
-        all_series = await _discover_tennis_series(client)
-
-        # For trading, only fetch match-winner markets (MATCH series)
-        # This filters out game markets, futures, field markets, etc.
-        match_series = [s for s in all_series if "MATCH" in s]
-        if not match_series:
-            match_series = list(_FALLBACK_SERIES)
-
-        all_raw_markets = []
-
-        for series in match_series:
-            try:
-                markets = await _kalshi_get_all(client, "/markets", params={
-                    "status": "open",
-                    "series_ticker": series,
-                    "limit": 100,
-                })
-                # Tag each market with its series ticker for classification
-                for m in markets:
-                    m["_series_ticker"] = series
-                all_raw_markets.extend(markets)
-            except httpx.HTTPStatusError:
-                continue
+    client = get_client()
+
+    # Dynamically discover all tennis series tickers, then keep the match-winner ones
+    match_series = _match_series(await _discover_tennis_series(client))
+
+    async def _fetch_series(series: str) -> list[dict]:
+        markets = []
+        async for page in _kalshi_iter_pages(client, "/markets", params={
+            "status": "open",
+            "series_ticker": series,
+            "limit": MARKETS_PAGE_LIMIT,
+        }):
+            # Tag each market with its series ticker for classification
+            # (runs while the next page is being fetched)
+            for m in page:
+                m["_series_ticker"] = series
+            markets.extend(page)
+        return markets
+
+    # All series are paginated concurrently over the same (HTTP/2) connection
+    results = await asyncio.gather(
+        *(_fetch_series(series) for series in match_series),
+        return_exceptions=True,
+    )
+
+    all_raw_markets = []
+    for markets in results:
+        if isinstance(markets, httpx.HTTPStatusError):
+            continue
+        if isinstance(markets, BaseException):
+            raise markets
+        all_raw_markets.extend(markets)
+
+    # Deduplicate by event_ticker (each event has 2 markets: YES player A, YES player B)
+    # We only need one per event — pick the one with the higher yes price (the favorite)
+    # (price is kept next to the market so it's computed once per market
+    # and handed on to the parser, which would otherwise compute it again)
+    # Entries are (rank, price, market): rank is price with None → 0, so each
+    # collision is a plain int compare.
+    events_seen: dict[str, tuple[int, Optional[int], dict]] = {}
+    for market in all_raw_markets:
+        event_ticker = market.get("event_ticker", "")
+        price = _get_market_price(market)
+        rank = price or 0
+
+        current = events_seen.get(event_ticker)
+        if current is None or rank > current[0]:
+            events_seen[event_ticker] = (rank, price, market)
+
+    # Parse unique markets (regex-heavy — off the event loop)
+    return await asyncio.to_thread(
+        _parse_all, [(price, market) for _, price, market in events_seen.values()], tournament_db
+    )
 
-        # Deduplicate by event_ticker (each event has 2 markets: YES player A, YES player B)
-        # We only need one per event — pick the one with the higher yes price (the favorite)
-        events_seen = {}
-        for market in all_raw_markets:
-            event_ticker = market.get("event_ticker", "")
-            price = _get_market_price(market) or 0
 
-            if event_ticker not in events_seen or price > (_get_market_price(events_seen[event_ticker]) or 0):
-                events_seen[event_ticker] = market
+def _parse_all(
+    priced_markets: list[tuple[Optional[int], dict]],
+    tournament_db: dict,
+) -> list[MatchData]:
+    """Parse a batch of deduplicated (price, market) pairs, dropping the ones that don't parse."""
+    matches = []
+    for price, market in priced_markets:
+        if price is None:
+            continue
+        match = _parse_priced_market(market, price, tournament_db)
+        if match:
+            matches.append(match)
+    return matches
 
-        # Parse unique markets
-        matches = []
-        for market in events_seen.values():
-            match = _parse_market(market, tournament_db)
-            if match:
-                matches.append(match)
 
-        return matches
+# Substrings debug_fetch looks for in tag names / market field names
+_DEBUG_TENNIS_TAG_HINTS = ("tennis", "atp", "wta", "challenger")
+_DEBUG_TIME_FIELD_HINTS = ("time", "date", "expir", "close", "open", "sched")
 
 
 async def debug_fetch(client: httpx.AsyncClient) -> dict:
     """Debug helper: shows discovery results and raw market data."""
-    import time
     global _tennis_series_cache_ts
 
     debug_info = {
@@ -332,9 +716,11 @@ async def debug_fetch(client: httpx.AsyncClient) -> dict:
         "parse_failures": [],
     }
 
-    # Step 1: Show raw discovery endpoint responses
+    # Step 1: Show raw discovery endpoint responses (both requested up front)
+    filters_req = asyncio.ensure_future(_kalshi_get(client, "/search/filters_by_sport"))
+    tags_req = asyncio.ensure_future(_kalshi_get(client, "/search/tags_by_categories"))
     try:
-        data = await _kalshi_get(client, "/search/filters_by_sport")
+        data = await filters_req
         filters = data.get("filters_by_sports", {})
 
         # Show ALL sports so we can see what tennis is called
@@ -351,7 +737,7 @@ async def debug_fetch(client: httpx.AsyncClient) -> dict:
         debug_info["discovery"]["filters_by_sport_error"] = str(e)
 
     try:
-        data = await _kalshi_get(client, "/search/tags_by_categories")
+        data = await tags_req
         tags_by_cat = data.get("tags_by_categories", {})
         # Show tennis-related tags, safely handling None values
         tennis_info = {}
@@ -361,7 +747,7 @@ async def debug_fetch(client: httpx.AsyncClient) -> dict:
                 all_cats_preview[cat] = f"({type(tags).__name__})"
                 continue
             safe_tags = [t for t in tags if isinstance(t, str)]
-            tennis_tags = [t for t in safe_tags if "tennis" in t.lower() or "atp" in t.lower() or "wta" in t.lower() or "challenger" in t.lower()]
+            tennis_tags = [t for t in safe_tags if _contains_any(t.lower(), _DEBUG_TENNIS_TAG_HINTS)]
             if tennis_tags:
                 tennis_info[cat] = tennis_tags
             all_cats_preview[cat] = safe_tags[:5]
@@ -377,25 +763,30 @@ async def debug_fetch(client: httpx.AsyncClient) -> dict:
     tennis_series = await _discover_tennis_series(client)
     debug_info["discovery"]["discovered_series"] = tennis_series
 
-    # Step 3: Fetch markets for each discovered series
-    all_raw = []
-
-    for series in tennis_series:
+    # Step 3: Fetch markets for each discovered series (all series concurrently)
+    async def _series_entry(series: str) -> tuple[dict, list[dict]]:
         entry = {"series": series}
+        markets = []
         try:
             markets = await _kalshi_get_all(client, "/markets", params={
                 "status": "open",
                 "series_ticker": series,
-                "limit": 100,
+                "limit": MARKETS_PAGE_LIMIT,
             })
             entry["count"] = len(markets)
 
-            # Count markets with actual prices
-            with_prices = [m for m in markets if _get_market_price(m) is not None]
-            entry["with_prices"] = len(with_prices)
-
-            if with_prices:
-                m = with_prices[0]
+            # Count markets with actual prices (and keep the first one as a sample)
+            first_with_price = None
+            n_with_prices = 0
+            for m in markets:
+                if _get_market_price(m) is not None:
+                    n_with_prices += 1
+                    if first_with_price is None:
+                        first_with_price = m
+            entry["with_prices"] = n_with_prices
+
+            if first_with_price is not None:
+                m = first_with_price
                 entry["sample_with_price"] = {
                     "ticker": m.get("ticker"),
                     "title": m.get("title"),
@@ -412,11 +803,14 @@ async def debug_fetch(client: httpx.AsyncClient) -> dict:
                 }
             if markets:
                 entry["first_title"] = markets[0].get("title", "")
-
-            all_raw.extend(markets)
         except Exception as e:
             entry["error"] = str(e)
+        return entry, markets
+
+    all_raw = []
+    for entry, markets in await asyncio.gather(*(_series_entry(s) for s in tennis_series)):
         debug_info["series_tried"].append(entry)
+        all_raw.extend(markets)
 
     if all_raw:
         debug_info["full_market_dump"] = all_raw[0]
@@ -424,15 +818,17 @@ async def debug_fetch(client: httpx.AsyncClient) -> dict:
         first = all_raw[0]
         debug_info["time_fields"] = {
             k: v for k, v in first.items()
-            if any(t in k.lower() for t in ["time", "date", "expir", "close", "open", "sched"])
+            if _contains_any(k.lower(), _DEBUG_TIME_FIELD_HINTS)
         }
 
     debug_info["raw_markets_found"] = len(all_raw)
 
-    # Try parsing and show results
+    # Try parsing and show results (price computed once per market), against
+    # the same tournament DB the trading path uses
+    tournament_db = load_tournament_db()
     for m in all_raw[:100]:
         price = _get_market_price(m)
-        result = _parse_market(m, {})
+        result = _parse_priced_market(m, price, tournament_db) if price is not None else None
         if result:
             debug_info["parsed_ok"] += 1
             debug_info["parsed_matches"].append({
@@ -451,52 +847,61 @@ async def debug_fetch(client: httpx.AsyncClient) -> dict:
                 "last_price": m.get("last_price"),
                 "yes_bid": m.get("yes_bid"),
                 "yes_ask": m.get("yes_ask"),
-                "reason": _debug_parse_failure(m),
+                "reason": _debug_parse_failure(m, price),
             })
 
     return debug_info
 
 
-def _debug_parse_failure(market: dict) -> str:
-    """Explain why a market failed to parse."""
-    price = _get_market_price(market)
+def _debug_parse_failure(market: dict, price: Optional[int]) -> str:
+    """Explain why a market failed to parse (price as from _get_market_price)."""
     if price is None:
         return f"No price (last={market.get('last_price')}, bid={market.get('yes_bid')}, ask={market.get('yes_ask')})"
+    status = market.get("status")
+    if status and status not in _TRADABLE_STATUSES:
+        return f"Not tradable (status={status})"
+    if not 0 < price < 100:
+        return f"Price out of range ({price})"
 
     title = market.get("title", "")
     rules = market.get("rules_primary", "")
-    players = _extract_players_from_title(title)
-    if not players:
-        players = _extract_players_from_rules(rules)
+    players = _extract_players(title, rules)
     if not players:
         return f"Could not extract players. title='{title}'"
 
     return "Unknown"
 
 
-def _parse_market(
+# Market statuses worth parsing. Markets are fetched with status=open, which
+# Kalshi reports back as "active"; anything else closed between pages
+_TRADABLE_STATUSES = ("active", "open")
+
+
+def _parse_priced_market(
     market: dict,
+    price: int,
     tournament_db: dict,
 ) -> Optional[MatchData]:
     """
     Parse a Kalshi market into our MatchData format.
-    Uses yes_bid/yes_ask/last_price for pricing.
-    Extracts players from title and rules_primary.
+    price comes from _get_market_price (yes_bid/yes_ask/last_price), computed
+    once by the caller. Extracts players from title and rules_primary.
     """
+    # Cheap rejections first, before the regex/classification work: a market
+    # that is no longer trading, or priced at the 0/100 bounds, can't be bet on
+    status = market.get("status")
+    if status and status not in _TRADABLE_STATUSES:
+        return None
+    if not 0 < price < 100:
+        return None
+
     event_ticker = market.get("event_ticker", "")
     title = market.get("title", "")
     rules = market.get("rules_primary", "")
     volume = market.get("volume", 0) or 0
 
-    # Get price
-    price = _get_market_price(market)
-    if price is None:
-        return None
-
     # Extract both player last names from the title "the X vs Y :"
-    players = _extract_players_from_title(title)
-    if not players:
-        players = _extract_players_from_rules(rules)
+    players = _extract_players(title, rules)
     if not players:
         return None
 
@@ -545,6 +950,59 @@ def _parse_market(
     )
 
 
+# Compiled once at import. Player extraction goes through the lru_cached
+# _extract_players, so these scan each distinct title/rules text once
+# "the LastName1 vs LastName2 :" — names are 1-3 words, anchored on "the" and ":"
+_TITLE_VS_ANCHORED_RE = re.compile(
+    r'\bthe\s+([\w\'-]+(?:\s+[\w\'-]+){0,2})\s+vs\.?\s+([\w\'-]+(?:\s+[\w\'-]+){0,2})\s*[:\-]',
+    re.IGNORECASE,
+)
+# "the LastName1 vs LastName2 ... match?"
+# Kept separate from the anchored pattern: one regex with a "[:-] or space"
+# terminator would pick the loose split first and let "-" glue the round into
+# the second name ("Sinner - Qualification")
+_TITLE_VS_LOOSE_RE = re.compile(
+    r'\bthe\s+([\w\'-]+(?:\s+[\w\'-]+){0,2})\s+vs\.?\s+([\w\'-]+(?:\s+[\w\'-]+){0,2})\s',
+    re.IGNORECASE,
+)
+# Fallback split points, tried in order (" vs. " anywhere beats " vs ")
+_TITLE_VS_SEPS = (
+    re.compile(r' vs\. ', re.IGNORECASE),
+    re.compile(r' vs ', re.IGNORECASE),
+)
+_TITLE_SPLIT_RE = re.compile(r'[:\?\-]')
+_RULES_VS_RE = re.compile(
+    r'(\w[\w\s\'-]+?)\s+vs\.?\s+(\w[\w\s\'-]+?)\s+professional', re.IGNORECASE
+)
+# "2026 ATP Rotterdam Qualification ..." → ("ATP", "Rotterdam ")
+_TOURNAMENT_NAME_RE = re.compile(
+    r'20\d{2}\s+(ATP|WTA)\s+([\w\s]+?)(?:Qualification|Round|Quarter|Semi|Final|match)'
+)
+
+
+def _name_case(name: str) -> str:
+    """
+    Title-case an extracted name unless it is already mixed-case. Kalshi
+    normally cases names correctly ("de Minaur", "McDonald"), which .title()
+    would mangle ("De Minaur", "Mcdonald"); all-lower/all-caps text is still
+    title-cased ("o'connell" → "O'Connell"). str.title() is one C pass; a
+    regex sub or per-word capitalize() would also break hyphens and
+    apostrophes ("Auger-aliassime", "O'brien").
+    """
+    if name.islower() or name.isupper():
+        return name.title()
+    return name
+
+
+# Title and rules don't change while a market is open, so every fetch cycle
+# after the first skips the regex scans. Keyed on the text (not the ticker),
+# so an edited title is simply a new entry.
+@functools.lru_cache(maxsize=4096)
+def _extract_players(title: str, rules: str) -> Optional[tuple[str, str]]:
+    """Player names from the title, falling back to rules_primary."""
+    return _extract_players_from_title(title) or _extract_players_from_rules(rules)
+
+
 def _extract_players_from_title(title: str) -> Optional[tuple[str, str]]:
     """
     Extract player names from Kalshi market title.
@@ -557,42 +1015,44 @@ def _extract_players_from_title(title: str) -> Optional[tuple[str, str]]:
     if not title:
         return None
 
+    # Every strategy below needs a literal "vs" — titles without one (futures,
+    # game markets) skip the regex scans. casefold() folds at least everything
+    # the IGNORECASE patterns treat as "v"/"s", so no matchable title is dropped.
+    if "vs" not in title.casefold():
+        return None
+
     # Primary pattern: "the LastName1 vs LastName2 :"
     # Names are 1-3 words, no spaces-greedy issue because we anchor on "the" and ":"
-    match = re.search(
-        r'\bthe\s+([\w\'-]+(?:\s+[\w\'-]+){0,2})\s+vs\.?\s+([\w\'-]+(?:\s+[\w\'-]+){0,2})\s*[:\-]',
-        title, re.IGNORECASE
-    )
+    match = _TITLE_VS_ANCHORED_RE.search(title)
     if match:
-        p1 = match.group(1).strip().title()
-        p2 = match.group(2).strip().title()
+        p1 = _name_case(match.group(1).strip())
+        p2 = _name_case(match.group(2).strip())
         if p1 and p2:
             return (p1, p2)
 
     # Secondary: "the LastName1 vs LastName2 ... match?"
-    match = re.search(
-        r'\bthe\s+([\w\'-]+(?:\s+[\w\'-]+){0,2})\s+vs\.?\s+([\w\'-]+(?:\s+[\w\'-]+){0,2})\s',
-        title, re.IGNORECASE
-    )
+    match = _TITLE_VS_LOOSE_RE.search(title)
     if match:
-        p1 = match.group(1).strip().title()
-        p2 = match.group(2).strip().title()
+        p1 = _name_case(match.group(1).strip())
+        p2 = _name_case(match.group(2).strip())
         if p1 and p2:
             return (p1, p2)
 
     # Fallback: find "vs" and take last 1-2 words before, first 1-2 words after
-    for sep in [" vs. ", " vs "]:
-        if sep in title.lower():
-            idx = title.lower().index(sep)
-            before = title[:idx].strip()
-            after = title[idx + len(sep):].strip()
+    # Searched on the original text: no lowered copy, whose indexes can drift
+    # from the title's ("İ".lower() is two characters)
+    for sep_re in _TITLE_VS_SEPS:
+        sep = sep_re.search(title)
+        if sep:
+            before = title[:sep.start()].strip()
+            after = title[sep.end():].strip()
 
             p1_words = before.split()[-2:]
-            p1 = " ".join(p1_words).title()
+            p1 = _name_case(" ".join(p1_words))
 
-            after_clean = re.split(r'[:\?\-]', after)[0].strip()
+            after_clean = _TITLE_SPLIT_RE.split(after, 1)[0].strip()
             p2_words = after_clean.split()[:2]
-            p2 = " ".join(p2_words).title()
+            p2 = _name_case(" ".join(p2_words))
 
             if p1 and p2:
                 return (p1, p2)
@@ -608,10 +1068,16 @@ def _extract_players_from_rules(rules: str) -> Optional[tuple[str, str]]:
     if not rules:
         return None
 
-    match = re.search(r'(\w[\w\s\'-]+?)\s+vs\.?\s+(\w[\w\s\'-]+?)\s+professional', rules, re.IGNORECASE)
+    # The lazy name groups make a failed search backtrack from every position
+    # — first check the literals the pattern needs
+    folded = rules.casefold()
+    if "vs" not in folded or "profess" not in folded:
+        return None
+
+    match = _RULES_VS_RE.search(rules)
     if match:
-        p1 = match.group(1).strip().title()
-        p2 = match.group(2).strip().title()
+        p1 = _name_case(match.group(1).strip())
+        p2 = _name_case(match.group(2).strip())
         if p1 and p2:
             return (p1, p2)
 
@@ -622,8 +1088,71 @@ def _name_matches(full_name: str, last_name: str) -> bool:
     """Check if a full name matches a last name (case-insensitive)."""
     if not full_name or not last_name:
         return False
-    return last_name.lower() in full_name.lower()
+    return last_name.casefold() in full_name.casefold()
+
+
+
+# Keyword tables for _classify_tournament (matched as substrings of the
+# lowercased text). Plain `in` checks are C-speed substring searches — faster
+# on these short texts than one combined regex scan. Tuples rather than
+# frozensets: these are substring tests, not token membership, and tuple
+# order sets which keyword is tried first.
+_GRAND_SLAM_KEYWORDS = (
+    "grand slam", "australian open", "roland garros", "french open", "wimbledon", "us open",
+)
+_CLAY_KEYWORDS = ("clay", "roland garros", "french open")
+_GRASS_KEYWORDS = ("grass", "wimbledon")
+
+
+class _TournamentIndex:
+    """
+    (lowercased name, (level, surface, name)) per tournament_db entry, in DB
+    order. Hashes by identity, so it is a cheap part of the _classify_cached
+    key: a classification is only ever reused for the index it was made with.
+    """
+    __slots__ = ("entries",)
 
+    def __init__(self, entries: list[tuple[str, tuple[TournamentLevel, Surface, str]]]):
+        self.entries = entries
+
+
+# (tournament_db it was built from, its index)
+_tournament_index_cache: tuple[Optional[dict], Optional[_TournamentIndex]] = (None, None)
+
+
+def _tournament_index(tournament_db: dict) -> _TournamentIndex:
+    """
+    The _TournamentIndex for tournament_db, built once per tournament_db
+    object — load_tournament_db() returns the same dict until tournaments.json
+    changes, so this runs once per reload instead of lowercasing every name
+    and re-resolving the enums per market.
+    """
+    global _tournament_index_cache
+    cached_db, index = _tournament_index_cache
+    if cached_db is not tournament_db or index is None:
+        index = _TournamentIndex([
+            (
+                name.lower(),
+                (
+                    TournamentLevel(info.get("level", "ATP")),
+                    Surface(info.get("surface", "Hard")),
+                    name,
+                ),
+            )
+            for name, info in tournament_db.items()
+        ])
+        # Swapped as one tuple: a parse running in a worker thread holds its
+        # own index, so it never classifies against another caller's DB
+        _tournament_index_cache = (tournament_db, index)
+    return index
+
+
+def _contains_any(text: str, keywords: tuple[str, ...]) -> bool:
+    """True if any keyword is a substring of text (stops at the first hit)."""
+    for kw in keywords:
+        if kw in text:
+            return True
+    return False
 
 
 def _classify_tournament(
@@ -632,17 +1161,32 @@ def _classify_tournament(
     series_ticker: str = "",
 ) -> tuple[TournamentLevel, Surface, str]:
     """Classify tournament from any available text."""
+    return _classify_cached(text, series_ticker, _tournament_index(tournament_db))
+
+
+# Keyed on the full text: it starts with the player names, so a prefix would
+# mix up different matches. Markets stay open across many fetch cycles, so
+# every cycle after the first reuses the result instead of rescanning the DB.
+# One joined string is the key rather than a (title, rules, ticker) tuple:
+# it is needed for the scan anyway, and saves building and hashing a tuple.
+@functools.lru_cache(maxsize=4096)
+def _classify_cached(
+    text: str,
+    series_ticker: str,
+    index: _TournamentIndex,
+) -> tuple[TournamentLevel, Surface, str]:
+    """
+    _classify_tournament against a prebuilt index. Entries made with the
+    index of an older tournament_db are never hit again and age out.
+    """
     title_lower = text.lower()
     ticker_upper = series_ticker.upper()
 
-    # Check tournament_db first
-    for name, info in tournament_db.items():
-        if name.lower() in title_lower:
-            return (
-                TournamentLevel(info.get("level", "ATP")),
-                Surface(info.get("surface", "Hard")),
-                name,
-            )
+    # Check tournament_db first (first DB entry found wins). Only texts
+    # missing from the lru_cache get here, so a plain scan is enough.
+    for name_lower, classification in index.entries:
+        if name_lower in title_lower:
+            return classification
 
     # Use series ticker for reliable level detection
     # Tickers: KXATPMATCH, KXWTAMATCH, KXATPCHALLENGERMATCH, KXWTACHALLENGERMATCH, etc.
@@ -651,22 +1195,19 @@ def _classify_tournament(
         level = TournamentLevel.CHALLENGER
     elif "WTA" in ticker_upper:
         level = TournamentLevel.WTA
-    elif "grand slam" in title_lower or any(
-        gs in title_lower
-        for gs in ["australian open", "roland garros", "french open", "wimbledon", "us open"]
-    ):
+    elif _contains_any(title_lower, _GRAND_SLAM_KEYWORDS):
         level = TournamentLevel.GRAND_SLAM
     elif "wta" in title_lower:
         level = TournamentLevel.WTA
 
     surface = Surface.HARD
-    if "clay" in title_lower or "roland garros" in title_lower or "french open" in title_lower:
+    if _contains_any(title_lower, _CLAY_KEYWORDS):
         surface = Surface.CLAY
-    elif "grass" in title_lower or "wimbledon" in title_lower:
+    elif _contains_any(title_lower, _GRASS_KEYWORDS):
         surface = Surface.GRASS
 
     # Extract tournament name from rules (e.g., "2026 ATP Rotterdam Qualification")
-    match = re.search(r'20\d{2}\s+(ATP|WTA)\s+([\w\s]+?)(?:Qualification|Round|Quarter|Semi|Final|match)', text)
+    match = _TOURNAMENT_NAME_RE.search(text)
     if match:
         tournament_name = f"{match.group(1)} {match.group(2).strip()}"
     else:
@@ -9,10 +9,11 @@ Endpoint: POST /trade-api/v2/portfolio/orders
 """
 
 import os
-import json
+import orjson
 import httpx
 import logging
-from app.kalshi_client import _auth_headers, KALSHI_BASE_URL
+from app.kalshi_client import _auth_headers, get_client, KALSHI_BASE_URL
+from app.circuit_breaker import CircuitBreaker, CircuitOpenError
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,9 @@ logger = logging.getLogger(__name__)
 CONTRACTS_PER_TRADE = int(os.getenv("CONTRACTS_PER_TRADE", "50"))
 MAX_CONTRACTS_PER_ORDER = int(os.getenv("MAX_CONTRACTS_PER_ORDER", "100"))
 
+# Trips after repeated timeouts / 5xx so an outage doesn't cost a timeout per order
+KALSHI_CB = CircuitBreaker("kalshi_orders")
+
 
 async def place_limit_order(
     ticker: str,
@@ -38,6 +42,7 @@ async def place_limit_order(
 
     Returns:
         dict with keys: dry_run, status, ticker, yes_price, count, order (if placed)
+        status is "circuit_open" (nothing sent) while the order breaker is tripped.
     """
     count = min(count, MAX_CONTRACTS_PER_ORDER)
 
@@ -66,15 +71,29 @@ async def place_limit_order(
         "yes_price": yes_price,
     }
 
+    async def _post() -> httpx.Response:
+        response = await get_client().post(url, headers=headers, content=orjson.dumps(payload))
+        # Only server-side errors count against the breaker; a 4xx is a bad order
+        if response.status_code >= 500:
+            response.raise_for_status()
+        return response
+
     try:
         headers = _auth_headers("POST", path)
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            result = response.json()
-            logger.info(f"Order placed successfully: {result}")
-            return {"dry_run": False, "status": "placed", "order": result}
+        response = await KALSHI_CB.call(_post)
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        logger.info(f"Order placed successfully: {result}")
+        return {"dry_run": False, "status": "placed", "order": result}
 
+    except CircuitOpenError as e:
+        logger.warning(f"Order skipped for {ticker}: {e}")
+        return {
+            "dry_run": False,
+            "status": "circuit_open",
+            "ticker": ticker,
+            "error": str(e),
+        }
     except httpx.HTTPStatusError as e:
         logger.error(f"Order failed {e.response.status_code} for {ticker}: {e.response.text}")
         return {
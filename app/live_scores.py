@@ -20,7 +20,10 @@ and adjust the _parse_* functions if needed.
 import os
 import time
 import logging
+import functools
+import unicodedata
 import httpx
+import orjson
 from typing import Optional
 from dataclasses import dataclass
 
@@ -31,6 +34,7 @@ TENNISAPI_BASE = f"https://{TENNISAPI_HOST}"
 TENNISAPI_KEY  = os.getenv("TENNISAPI_KEY", "")
 
 # Cache: avoid hitting the API on every 10s scan for the same match
+# (time.monotonic() stored, score) — a wall-clock step can't stretch the TTL
 _score_cache: dict[str, tuple[float, "LiveScore"]] = {}
 CACHE_TTL = 15  # seconds — scores are cached for 15s max
 
@@ -124,7 +128,9 @@ async def fetch_live_events() -> list[dict]:
                 headers=_headers(),
             )
             resp.raise_for_status()
-            data = resp.json()
+            # Every live match in one payload — orjson parses the raw bytes
+            # without httpx's charset sniffing + str decode
+            data = orjson.loads(resp.content)
 
             # The response might be {"events": [...]} or just [...]
             if isinstance(data, dict):
@@ -209,9 +215,12 @@ def _parse_live_score(event: dict) -> Optional[LiveScore]:
         return None
 
 
+@functools.lru_cache(maxsize=1024)
 def _normalize_name(name: str) -> str:
-    """Normalize player name for matching: lowercase, strip accents/periods."""
-    import unicodedata
+    """
+    Normalize player name for matching: lowercase, strip accents/periods.
+    Cached — the same few names are compared against every live event.
+    """
     name = unicodedata.normalize("NFD", name)
     name = "".join(c for c in name if unicodedata.category(c) != "Mn")
     return name.lower().strip().replace(".", "").replace("-", " ")
@@ -258,7 +267,7 @@ async def find_live_score(player_fav: str, player_dog: str) -> Optional[tuple[Li
     # Check cache
     if cache_key in _score_cache:
         cached_time, cached_score = _score_cache[cache_key]
-        if time.time() - cached_time < CACHE_TTL:
+        if time.monotonic() - cached_time < CACHE_TTL:
             # Determine fav_is_home from cached data
             fav_is_home = _names_match(player_fav, cached_score.home_player)
             return cached_score, fav_is_home
@@ -279,8 +288,7 @@ async def find_live_score(player_fav: str, player_dog: str) -> Optional[tuple[Li
         dog_is_away = _names_match(player_dog, score.away_player)
 
         if (fav_is_home and dog_is_away) or (fav_is_away and dog_is_home):
-            fav_is_home = _names_match(player_fav, score.home_player)
-            _score_cache[cache_key] = (time.time(), score)
+            _score_cache[cache_key] = (time.monotonic(), score)
             logger.info(
                 f"Live score found: {score.home_player} vs {score.away_player} "
                 f"— Sets: {score.home_sets}-{score.away_sets} "
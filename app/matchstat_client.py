@@ -19,13 +19,26 @@ Configuración (.env):
   MATCHSTAT_API_KEY            Tu x-rapidapi-key
   MATCHSTAT_MIN_WIN_PCT=0.60   Win% mínimo en H2H para confirmar (default 60%)
   MATCHSTAT_MIN_H2H_MATCHES=3  Mínimo de partidos H2H para confiar en el dato (default 3)
+  MATCHSTAT_H2H_CACHE_HOURS=24 Horas que se reutiliza un H2H guardado en SQLite (default 24)
+  MATCHSTAT_H2H_EMPTY_CACHE_HOURS=6  Igual, para H2H sin partidos (default 6)
+
+Los resultados H2H se guardan en la tabla h2h_cache de data/orders.db, así que
+sobreviven a reinicios y cada par de jugadores cuesta una llamada de pago al
+día en vez de una por ciclo. Los errores (5xx, timeouts, 4xx) y las respuestas
+que no se pueden interpretar no se cachean.
 """
 
 import os
+import time
 import httpx
+import orjson
 import logging
 from typing import Optional
 from app.models import TournamentLevel
+from app.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.db import get_conn, transaction
+from app.http_client import LoopBoundClient
+from app.player_ids import find_player_id
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +47,20 @@ MATCHSTAT_BASE    = f"https://{MATCHSTAT_HOST}"
 
 MATCHSTAT_MIN_WIN_PCT    = float(os.getenv("MATCHSTAT_MIN_WIN_PCT", "0.60"))
 MATCHSTAT_MIN_H2H        = int(os.getenv("MATCHSTAT_MIN_H2H_MATCHES", "3"))
+H2H_CACHE_SECONDS        = float(os.getenv("MATCHSTAT_H2H_CACHE_HOURS", "24")) * 3600
+H2H_EMPTY_CACHE_SECONDS  = float(os.getenv("MATCHSTAT_H2H_EMPTY_CACHE_HOURS", "6")) * 3600
+
+# Conexiones keep-alive hacia RapidAPI: un lote de confirmaciones reutiliza
+# la misma sesión TLS en vez de hacer un handshake por cada H2H
+MAX_KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY          = 60.0
+
+# Circuit breaker: tras varios fallos seguidos (timeouts / 5xx) se dejan de
+# hacer llamadas H2H hasta que pase CIRCUIT_RESET_SECONDS
+MATCHSTAT_CB = CircuitBreaker("matchstat")
 
-# Cache de player IDs para evitar searches repetidos en un mismo ciclo
+# Cache de player IDs para evitar searches repetidos en un mismo ciclo.
+# No se persiste: sale del mapa estático, reconstruirlo tras un reinicio es gratis
 _player_id_cache: dict[str, int | None] = {}
 
 
@@ -47,6 +72,31 @@ def _headers() -> dict:
     }
 
 
+def _new_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        base_url=MATCHSTAT_BASE,
+        http2=True,
+        limits=httpx.Limits(
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+        timeout=8.0,
+    )
+
+
+_client = LoopBoundClient(_new_client)
+
+
+def get_client() -> httpx.AsyncClient:
+    """Cliente HTTP compartido para Matchstat (ver app/http_client.py)."""
+    return _client.get()
+
+
+async def close_client():
+    """Cierra el cliente compartido (shutdown de la app)."""
+    await _client.aclose()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Paso 1: obtener player ID por nombre (mapa estático)
 # ─────────────────────────────────────────────────────────────────────────────
@@ -66,7 +116,6 @@ async def _search_player_id(name: str) -> Optional[int]:
     if name in _player_id_cache:
         return _player_id_cache[name]
 
-    from app.player_ids import find_player_id
     player_id = find_player_id(name)
 
     if player_id is not None:
@@ -85,6 +134,61 @@ async def _search_player_id(name: str) -> Optional[int]:
 # Paso 2: obtener H2H histórico entre dos jugadores
 # ─────────────────────────────────────────────────────────────────────────────
 
+async def init_h2h_cache():
+    """Crea la tabla h2h_cache si no existe. Llamado desde main.py al arrancar."""
+    async with transaction() as db:
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS h2h_cache (
+                id_fav     INTEGER NOT NULL,
+                id_dog     INTEGER NOT NULL,
+                tour       TEXT    NOT NULL,
+                win_pct    REAL,
+                total      INTEGER NOT NULL,
+                fetched_at REAL    NOT NULL,
+                PRIMARY KEY (id_fav, id_dog, tour)
+            )
+        """)
+
+
+async def _load_cached_h2h(
+    id_fav: int, id_dog: int, tour: str,
+) -> Optional[tuple[Optional[float], int]]:
+    """(win_pct, total) guardado si sigue vigente; None si hay que pedirlo a la API."""
+    try:
+        db = await get_conn()
+        cursor = await db.execute(
+            "SELECT win_pct, total, fetched_at FROM h2h_cache"
+            " WHERE id_fav = ? AND id_dog = ? AND tour = ?",
+            (id_fav, id_dog, tour),
+        )
+        row = await cursor.fetchone()
+    except Exception as e:
+        # Sin cache (p.ej. tabla aún no creada) seguimos con la llamada HTTP
+        logger.warning(f"H2H cache read failed: {e}")
+        return None
+    if row is None:
+        return None
+    ttl = H2H_CACHE_SECONDS if row["total"] > 0 else H2H_EMPTY_CACHE_SECONDS
+    if time.time() - row["fetched_at"] > ttl:
+        return None
+    return row["win_pct"], row["total"]
+
+
+async def _store_h2h(
+    id_fav: int, id_dog: int, tour: str, win_pct: Optional[float], total: int,
+):
+    try:
+        async with transaction() as db:
+            await db.execute(
+                "INSERT OR REPLACE INTO h2h_cache"
+                " (id_fav, id_dog, tour, win_pct, total, fetched_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (id_fav, id_dog, tour, win_pct, total, time.time()),
+            )
+    except Exception as e:
+        logger.warning(f"H2H cache write failed: {e}")
+
+
 async def _get_h2h_win_pct(
     id_fav: int,
     id_dog: int,
@@ -93,37 +197,61 @@ async def _get_h2h_win_pct(
     """
     Llama a /tennis/v2/{tour}/h2h/stats/{id_fav}/{id_dog}/
     y devuelve (win_pct_del_favorito, total_partidos_h2h).
+    Lanza CircuitOpenError si el circuit breaker de Matchstat está abierto,
+    y re-lanza los errores transitorios (429, 5xx, timeouts / red): no dicen
+    nada del H2H y el partido debe reintentarse en el siguiente ciclo.
 
     !! Actualiza _parse_h2h_wins() con la estructura JSON real !!
     """
     tour = "wta" if is_wta else "atp"
     path = f"/tennis/v2/{tour}/h2h/stats/{id_fav}/{id_dog}/"
 
-    try:
-        async with httpx.AsyncClient(timeout=8.0) as client:
-            resp = await client.get(
-                f"{MATCHSTAT_BASE}{path}",
-                headers=_headers(),
-            )
+    cached = await _load_cached_h2h(id_fav, id_dog, tour)
+    if cached is not None:
+        logger.debug(f"H2H {id_fav} vs {id_dog}: cache hit {cached}")
+        return cached
+
+    async def _fetch() -> httpx.Response:
+        resp = await get_client().get(path, headers=_headers())
+        # Solo errores del servidor cuentan para el circuit breaker;
+        # un 4xx significa que la API responde bien
+        if resp.status_code >= 500:
             resp.raise_for_status()
-            data = resp.json()
-            logger.debug(f"H2H {id_fav} vs {id_dog}: {str(data)[:400]}")
-            wins_fav, total = _parse_h2h_wins(data, id_fav)
-            if total == 0:
-                return None, 0
-            return wins_fav / total, total
+        return resp
 
+    try:
+        resp = await MATCHSTAT_CB.call(_fetch)
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+        logger.debug(f"H2H {id_fav} vs {id_dog}: {str(data)[:400]}")
+        parsed = _parse_h2h_wins(data, id_fav)
+        if parsed is None:
+            return None, 0
+        wins_fav, total = parsed
+        result = (wins_fav / total, total) if total else (None, 0)
+        await _store_h2h(id_fav, id_dog, tour, *result)
+        return result
+
+    except CircuitOpenError:
+        raise
     except httpx.HTTPStatusError as e:
-        logger.error(f"H2H error {e.response.status_code} ({path}): {e.response.text[:200]}")
+        status = e.response.status_code
+        if status == 429 or status >= 500:
+            raise
+        logger.error(f"H2H error {status} ({path}): {e.response.text[:200]}")
         return None, 0
+    except httpx.TransportError:
+        raise
     except Exception as e:
         logger.error(f"H2H failed ({path}): {e}")
         return None, 0
 
 
-def _parse_h2h_wins(data: dict | list, id_fav: int) -> tuple[int, int]:
+def _parse_h2h_wins(data: dict | list, id_fav: int) -> Optional[tuple[int, int]]:
     """
     Extrae (partidos_ganados_por_fav, total_partidos) del response H2H.
+    (0, 0) si no hay partidos H2H; None si el payload no se pudo interpretar
+    (ese caso no se cachea).
 
     Estructura real del endpoint /tennis/v2/atp/h2h/stats/{id1}/{id2}/:
     {
@@ -135,14 +263,14 @@ def _parse_h2h_wins(data: dict | list, id_fav: int) -> tuple[int, int]:
     }
     """
     if not isinstance(data, dict):
-        return 0, 0
+        return None
     inner = data.get("data", {})
     if not isinstance(inner, dict):
-        return 0, 0
+        return None
     try:
         total = int(inner.get("matchesCount", 0))
     except (TypeError, ValueError):
-        return 0, 0
+        return None
     if total == 0:
         return 0, 0
     p1 = inner.get("player1Stats", {}) or {}
@@ -152,7 +280,7 @@ def _parse_h2h_wins(data: dict | list, id_fav: int) -> tuple[int, int]:
     elif str(p2.get("id", "")) == str(id_fav):
         return int(p2.get("matchesWon", 0)), total
     logger.warning(f"H2H: fav_id={id_fav} no encontrado en p1.id={p1.get('id')} / p2.id={p2.get('id')}")
-    return 0, 0
+    return None
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -169,6 +297,8 @@ async def get_player_win_probability(
     entre player_fav y player_dog (0.0–1.0), o None si no hay datos.
 
     Usado por automation.py para confirmar señales BUY antes de poner órdenes.
+    Lanza CircuitOpenError si Matchstat está caído (circuit breaker abierto)
+    y httpx.HTTPStatusError / TransportError en errores transitorios.
     """
     api_key = os.getenv("MATCHSTAT_API_KEY")
     if not api_key:
@@ -41,31 +41,51 @@ WTA_PLAYER_IDS: dict[str, int] = {
 }
 
 
+def _casefold_keys(lookup: dict[str, int]) -> dict[str, int]:
+    """The table keyed by casefolded name ("Straße" and "STRASSE" compare equal)."""
+    return {key.casefold(): pid for key, pid in lookup.items()}
+
+
+def _last_name_index(lookup: dict[str, int]) -> dict[str, int]:
+    """last name → ID; the first entry wins when two players share a last name."""
+    index: dict[str, int] = {}
+    for key, pid in lookup.items():
+        key_parts = key.split()
+        if key_parts:
+            index.setdefault(key_parts[-1], pid)
+    return index
+
+
+# Built once at import — the tables above are static
+_ATP_BY_NAME = _casefold_keys(ATP_PLAYER_IDS)
+_WTA_BY_NAME = _casefold_keys(WTA_PLAYER_IDS)
+_ATP_LAST_NAMES = _last_name_index(_ATP_BY_NAME)
+_WTA_LAST_NAMES = _last_name_index(_WTA_BY_NAME)
+
+
 def find_player_id(name: str, is_wta: bool = False) -> int | None:
     """
     Find player ID by name (case-insensitive).
     Tries exact match, then substring match, then last-name match.
     Returns None if not found.
     """
-    lookup = WTA_PLAYER_IDS if is_wta else ATP_PLAYER_IDS
-    name_lower = name.strip().lower()
+    lookup = _WTA_BY_NAME if is_wta else _ATP_BY_NAME
+    # casefold() rather than lower(): the full Unicode caseless match
+    name_folded = name.strip().casefold()
 
     # 1. Exact match
-    if name_lower in lookup:
-        return lookup[name_lower]
+    if name_folded in lookup:
+        return lookup[name_folded]
 
     # 2. Stored key is contained in searched name, or vice-versa
     for key, pid in lookup.items():
-        if key in name_lower or name_lower in key:
+        if key in name_folded or name_folded in key:
             return pid
 
     # 3. Last-name match
-    parts = name_lower.split()
-    last = parts[-1] if parts else ""
-    if last:
-        for key, pid in lookup.items():
-            key_parts = key.split()
-            if key_parts and key_parts[-1] == last:
-                return pid
+    parts = name_folded.split()
+    if parts:
+        last_names = _WTA_LAST_NAMES if is_wta else _ATP_LAST_NAMES
+        return last_names.get(parts[-1])
 
     return None
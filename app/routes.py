@@ -2,6 +2,8 @@
 API routes for the tennis trading dashboard.
 """
 
+from typing import Optional
+
 from fastapi import APIRouter, HTTPException
 from app.kalshi_client import fetch_tennis_markets
 from app.tennis_data import load_tournament_db
@@ -74,12 +76,10 @@ async def debug_kalshi():
     Debug endpoint: shows raw Kalshi data at each step —
     which series return data, raw market fields, and parse results.
     """
-    import httpx
-    from app.kalshi_client import debug_fetch
+    from app.kalshi_client import debug_fetch, get_client
 
     try:
-        async with httpx.AsyncClient() as client:
-            return await debug_fetch(client)
+        return await debug_fetch(get_client())
     except Exception as e:
         return {"error": str(e)}
 
@@ -340,15 +340,31 @@ async def automation_run_once():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _parse_columns(columns: Optional[str]) -> Optional[tuple[str, ...]]:
+    """?columns=a,b,c → ('a', 'b', 'c'); None/empty → None (endpoint default)."""
+    if not columns:
+        return None
+    return tuple(c.strip() for c in columns.split(",") if c.strip())
+
+
 @router.get("/automation/orders")
-async def automation_orders():
+async def automation_orders(limit: int = 200, cursor: str = None, columns: str = None):
     """
     Return the log of all processed orders (placed, simulated, and rejected).
-    Newest first, max 200 records.
+    Newest first, max 200 records per page; pass next_cursor back as ?cursor=
+    for the next page. ?columns=a,b,c selects fields (order_response is only
+    returned when asked for).
     """
     try:
-        orders = await get_all_orders()
-        return {"orders": orders, "count": len(orders)}
+        cols = _parse_columns(columns)
+        page = await get_all_orders(
+            limit=max(1, min(limit, 200)), cursor=cursor,
+            **({"columns": cols} if cols else {}),
+        )
+        orders = page["rows"]
+        return {"orders": orders, "count": len(orders), "next_cursor": page["next_cursor"]}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -383,14 +399,22 @@ async def bets_track(payload: dict):
 
 
 @router.get("/bets")
-async def bets_list(status: str = None):
+async def bets_list(status: str = None, limit: int = None, cursor: str = None, columns: str = None):
     """
     Return all tracked bets.
     Optional ?status=pending or ?status=completed filter.
+    Optional ?limit=N&cursor=... paging and ?columns=a,b,c projection.
     """
     try:
-        bets = await get_all_bets(status=status)
-        return {"bets": bets, "count": len(bets)}
+        cols = _parse_columns(columns)
+        page = await get_all_bets(
+            status=status, limit=max(1, limit) if limit is not None else None,
+            cursor=cursor, **({"columns": cols} if cols else {}),
+        )
+        bets = page["rows"]
+        return {"bets": bets, "count": len(bets), "next_cursor": page["next_cursor"]}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -431,14 +455,12 @@ async def bets_update_outcome(bet_id: int, payload: dict):
 @router.delete("/bets/{bet_id}")
 async def bets_delete(bet_id: int):
     """Delete a tracked bet by ID."""
-    import aiosqlite
-    from app.bet_tracker import DB_PATH
+    from app.db import transaction
     bet = await get_bet_by_id(bet_id)
     if not bet:
         raise HTTPException(status_code=404, detail="Bet not found")
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with transaction() as db:
         await db.execute("DELETE FROM tracked_bets WHERE id = ?", (bet_id,))
-        await db.commit()
     return {"status": "ok", "deleted_id": bet_id}
 
 
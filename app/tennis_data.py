@@ -1,19 +1,36 @@
 """
 Tennis data helpers — tournament database loader.
+
+The parsed tournament DB is cached per process and reloaded only when
+tournaments.json changes on disk (mtime check), so edits to the file are
+picked up on the next call without a restart.
 """
 
 import json
 from pathlib import Path
+from typing import Optional
 
 DATA_DIR = Path(__file__).parent.parent / "data"
+TOURNAMENTS_PATH = DATA_DIR / "tournaments.json"
+
+_cache: dict = {}
+_cache_mtime: Optional[int] = None
 
 
 def load_tournament_db() -> dict:
     """
     Load tournament database (tournament name -> level + surface).
-    Static JSON file we maintain.
+    Static JSON file we maintain. Callers must treat the result as read-only —
+    the same dict is shared until the file changes.
     """
-    path = DATA_DIR / "tournaments.json"
-    if path.exists():
-        return json.loads(path.read_text())
-    return {}
+    global _cache, _cache_mtime
+    try:
+        mtime = TOURNAMENTS_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        _cache, _cache_mtime = {}, None
+        return _cache
+
+    if mtime != _cache_mtime:
+        _cache = json.loads(TOURNAMENTS_PATH.read_text())
+        _cache_mtime = mtime
+    return _cache
@@ -83,9 +83,12 @@ import sqlite3
 import base64
 import logging
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
+import functools
 import httpx
 from pathlib import Path
+from typing import Callable
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 
@@ -96,13 +99,26 @@ try:
 except ImportError:
     pass
 
+# orjson decodes response bodies straight from bytes, faster than stdlib json
+# and encodes order payloads the same way
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    from json import dumps as _json_dumps, loads as _json_loads
+
 # ── Config ────────────────────────────────────────────────────────────────────
 BASE_URL      = os.getenv("KALSHI_BASE_URL", "https://api.elections.kalshi.com/trade-api/v2")
 API_KEY       = os.getenv("KALSHI_API_KEY", "")
 API_SECRET    = os.getenv("KALSHI_API_SECRET", "")
 POLL_INTERVAL = int(os.getenv("POLL_INTERVAL", "10"))
+SCAN_WORKERS  = int(os.getenv("SCAN_WORKERS", "8"))   # parallel Kalshi reads per scan
 DRY_RUN       = os.getenv("DRY_RUN", "true").lower() == "true"
 DB_PATH       = os.getenv("DB_PATH", "data/orders.db")
+# Reuse one signature per endpoint for this many ms (0 = sign every request)
+SIGNATURE_REUSE_MS = int(os.getenv("KALSHI_SIGNATURE_REUSE_MS", "500"))
+# Idle keep-alive (s) — must outlast POLL_INTERVAL, or every scan re-handshakes
+# (httpx's default is 5 s)
+KEEPALIVE_EXPIRY = 60.0
 
 # Mode detection threshold (¢): below this → LONGSHOT mode
 LONGSHOT_THRESHOLD = int(os.getenv("LONGSHOT_THRESHOLD", "30"))
@@ -159,6 +175,9 @@ log = logging.getLogger("kalshi-bot")
 
 # ── RSA Authentication ────────────────────────────────────────────────────────
 _private_key = None
+# Immutable — built once instead of on every signature
+_SHA256 = hashes.SHA256()
+_PSS_PADDING = padding.PSS(mgf=padding.MGF1(_SHA256), salt_length=padding.PSS.DIGEST_LENGTH)
 
 
 def _load_key():
@@ -172,17 +191,32 @@ def _load_key():
     return _private_key
 
 
+def _sign(method: str, path: str, ts: str) -> str:
+    message = f"{ts}{method}{path}".encode()
+    sig = _load_key().sign(message, _PSS_PADDING, _SHA256)
+    return base64.b64encode(sig).decode()
+
+
+@functools.lru_cache(maxsize=64)
+def _signed_timestamp(method: str, path: str, bucket: int) -> tuple[str, str]:
+    # The signature covers only ts + method + path → reusable within one window.
+    # Hits come from the fixed endpoints the scan workers share
+    # (/portfolio/fills, /portfolio/orders); /markets/{ticker} differs per position.
+    ts = str(bucket * SIGNATURE_REUSE_MS)
+    return ts, _sign(method, path, ts)
+
+
 def _auth_headers(method: str, path: str) -> dict:
-    ts = str(int(time.time() * 1000))
-    message = f"{ts}{method}{path.split('?')[0]}".encode()
-    sig = _load_key().sign(
-        message,
-        padding.PSS(mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.DIGEST_LENGTH),
-        hashes.SHA256(),
-    )
+    now_ms = time.time_ns() // 1_000_000
+    path = path.split('?')[0]
+    if SIGNATURE_REUSE_MS > 0:
+        ts, sig = _signed_timestamp(method, path, now_ms // SIGNATURE_REUSE_MS)
+    else:
+        ts = str(now_ms)
+        sig = _sign(method, path, ts)
     return {
         "KALSHI-ACCESS-KEY": API_KEY,
-        "KALSHI-ACCESS-SIGNATURE": base64.b64encode(sig).decode(),
+        "KALSHI-ACCESS-SIGNATURE": sig,
         "KALSHI-ACCESS-TIMESTAMP": ts,
         "Content-Type": "application/json",
     }
@@ -194,18 +228,18 @@ def _get(client: httpx.Client, path: str, params: dict = None) -> dict:
     resp = client.get(url, headers=_auth_headers("GET", f"/trade-api/v2{path}"),
                       params=params, timeout=15.0)
     resp.raise_for_status()
-    return resp.json()
+    return _json_loads(resp.content)
 
 
 def _post(client: httpx.Client, path: str, body: dict) -> dict:
     url  = f"{BASE_URL}{path}"
     resp = client.post(url, headers=_auth_headers("POST", f"/trade-api/v2{path}"),
-                       json=body, timeout=15.0)
+                       content=_json_dumps(body), timeout=15.0)
     if not resp.is_success:
         raise httpx.HTTPStatusError(
             f"{resp.status_code} {resp.text}", request=resp.request, response=resp
         )
-    return resp.json()
+    return _json_loads(resp.content)
 
 
 # ── Kalshi API Calls ──────────────────────────────────────────────────────────
@@ -214,8 +248,13 @@ def get_open_positions(client: httpx.Client) -> list[dict]:
     return [p for p in data.get("market_positions", []) if (p.get("position") or 0) > 0]
 
 
-def get_avg_buy_price(client: httpx.Client, ticker: str) -> float | None:
-    """Weighted average YES buy price in cents, or None."""
+def get_avg_buy_price(
+    client: httpx.Client, ticker: str, warn: Callable[[str], None] = log.warning,
+) -> float | None:
+    """
+    Weighted average YES buy price in cents, or None.
+    Problems are reported through warn (run_scan collects them to log later).
+    """
     fills, cursor = [], None
     for _ in range(5):
         params = {"ticker": ticker, "limit": 100}
@@ -224,7 +263,7 @@ def get_avg_buy_price(client: httpx.Client, ticker: str) -> float | None:
         try:
             data = _get(client, "/portfolio/fills", params=params)
         except Exception as e:
-            log.warning(f"    Could not read fills for {ticker}: {e}")
+            warn(f"    Could not read fills for {ticker}: {e}")
             return None
         page = data.get("fills", [])
         fills.extend(page)
@@ -234,7 +273,7 @@ def get_avg_buy_price(client: httpx.Client, ticker: str) -> float | None:
 
     buy_fills = [f for f in fills if f.get("action") == "buy" and f.get("side") == "yes"]
     if not buy_fills:
-        log.warning(f"    No YES buy fills found for {ticker}.")
+        warn(f"    No YES buy fills found for {ticker}.")
         return None
 
     total_qty  = sum(f.get("count", 0) for f in buy_fills)
@@ -245,9 +284,12 @@ def get_avg_buy_price(client: httpx.Client, ticker: str) -> float | None:
     return total_cost / total_qty if total_qty else None
 
 
-def get_market_prices(client: httpx.Client, ticker: str) -> tuple[int | None, int | None]:
+def get_market_prices(
+    client: httpx.Client, ticker: str, warn: Callable[[str], None] = log.warning,
+) -> tuple[int | None, int | None]:
     """
     Returns (ref_price, yes_bid) in whole cents, or (None, None).
+    Problems are reported through warn, as in get_avg_buy_price.
 
     ref_price  — last traded price; used for P&L calculation and stop-loss
                  decisions so that wide bid/ask spreads in live in-play
@@ -268,7 +310,7 @@ def get_market_prices(client: httpx.Client, ticker: str) -> tuple[int | None, in
         ref_price = int(last_p) if last_p and int(last_p) > 0 else yes_bid
         return ref_price, yes_bid
     except Exception as e:
-        log.warning(f"    Could not read market data for {ticker}: {e}")
+        warn(f"    Could not read market data for {ticker}: {e}")
         return None, None
 
 
@@ -821,14 +863,29 @@ def run_scan(client: httpx.Client):
 
     log.info(f"Found {len(positions)} open position(s).")
 
-    for pos in positions:
-        ticker = pos.get("ticker", "")
+    # Fills + market price for every position are independent reads — fetch
+    # them all in parallel (httpx.Client is thread-safe) instead of 2 round
+    # trips per position back to back. Evaluation below stays sequential: it
+    # places orders and writes state. Fetch warnings are held per position and
+    # logged under its "[ticker] N contract(s)" line, not as they happen.
+    tickers = [pos.get("ticker", "") for pos in positions]
+    fill_warnings  = [[] for _ in tickers]
+    price_warnings = [[] for _ in tickers]
+    with ThreadPoolExecutor(max_workers=max(1, min(SCAN_WORKERS, 2 * len(tickers)))) as pool:
+        avg_buys = [pool.submit(get_avg_buy_price, client, t, w.append)
+                    for t, w in zip(tickers, fill_warnings)]
+        prices   = [pool.submit(get_market_prices, client, t, w.append)
+                    for t, w in zip(tickers, price_warnings)]
+
+    for i, (pos, ticker) in enumerate(zip(positions, tickers)):
         count  = pos.get("position", 0)
 
         log.info(f"  [{ticker}]  {count} contract(s)")
+        for msg in fill_warnings[i] + price_warnings[i]:
+            log.warning(msg)
 
-        avg_buy              = get_avg_buy_price(client, ticker)
-        ref_price, yes_bid   = get_market_prices(client, ticker)
+        avg_buy              = avg_buys[i].result()
+        ref_price, yes_bid   = prices[i].result()
 
         if avg_buy is None:
             log.warning("    Skipping — could not determine average buy price.")
@@ -898,10 +955,11 @@ def main():
         log.info("  Set DRY_RUN=false in .env when ready to go live.")
         log.info("=" * 72)
 
-    with httpx.Client() as client:
+    limits = httpx.Limits(max_keepalive_connections=SCAN_WORKERS, keepalive_expiry=KEEPALIVE_EXPIRY)
+    with httpx.Client(limits=limits) as client:
         while True:
             if _is_bot_enabled():
-                now = datetime.datetime.now().strftime("%H:%M:%S")
+                now = time.strftime("%H:%M:%S")
                 log.info(f"─── Scan @ {now} " + "─" * 47)
                 run_scan(client)
                 log.info(f"Sleeping {POLL_INTERVAL}s...\n")
@@ -15,7 +15,10 @@ load_dotenv()
 
 from app.routes import router
 from app.scheduler import setup_scheduler
-from app.bet_tracker import init_bets_db, DB_PATH
+from app.bet_tracker import init_bets_db
+from app.matchstat_client import init_h2h_cache, close_client as close_matchstat_client
+from app.db import DB_PATH, close_conn
+from app.kalshi_client import warmup as kalshi_warmup, close_client as close_kalshi_client
 
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger("tennisbot")
@@ -33,6 +36,9 @@ app.include_router(router)
 @app.on_event("startup")
 async def on_startup():
     """Initialize DBs and scheduler on server start."""
+    await kalshi_warmup()
+    # Before the scheduler: with AUTOMATION_AUTOSTART the first cycle reads it
+    await init_h2h_cache()
     await setup_scheduler()
     await init_bets_db()
 
@@ -46,6 +52,14 @@ async def on_startup():
     else:
         log.warning("⚠️  DB NOT FOUND at %s — volume may not be mounted", DB_PATH)
 
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    """Close the shared SQLite connection and the Kalshi/Matchstat HTTP clients."""
+    await close_conn()
+    await close_kalshi_client()
+    await close_matchstat_client()
+
 # Serve static frontend
 static_dir = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")